@@ -1,5 +1,6 @@
 import sys
 import os
+import multiprocessing
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
@@ -89,4 +90,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # 打包后全文索引的进程池需要它来启动子进程
+    multiprocessing.freeze_support()
     main()
@@ -37,33 +37,72 @@ def correct_ocr_text(text: str) -> str:
         corrected = corrected.replace(wrong, right)
     return corrected
 
+def _extract_pages_text(doc, max_pages: int) -> str:
+    return "".join(doc[i].get_text("text") + "\n" for i in range(min(max_pages, len(doc))))
+
 def extract_text_from_pdf(pdf_path: str, max_pages: int = 5) -> Tuple[str, int]:
     text = ""
     total_pages = 0
     try:
-        doc = fitz.open(pdf_path)
-        total_pages = len(doc)
-        for i in range(min(max_pages, total_pages)):
-            page = doc[i]
-            text += page.get_text("text") + "\n"
-        doc.close()
+        with fitz.open(pdf_path) as doc:
+            total_pages = len(doc)
+            text = _extract_pages_text(doc, max_pages)
     except Exception as e:
         logger.error(f"Failed to extract text from {pdf_path}: {e}")
     return text, total_pages
 
+# 全文索引只需纯文本：不保留连字和原始空白（连字拆开反而便于检索），仅裁剪到页面范围
+FULLTEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+# 单个文件的索引上限，防止异常的超大PDF拖慢索引或占满内存
+FULLTEXT_MAX_PAGES = 500
+FULLTEXT_MAX_CHARS = 5_000_000
+
+def extract_fulltext(pdf_path: str) -> str:
+    """提取PDF页面文本，用于建立全文索引（模块级函数，可在子进程中执行）"""
+    parts = []
+    total = 0
+    with fitz.open(pdf_path) as doc:
+        for i, page in enumerate(doc):
+            if i >= FULLTEXT_MAX_PAGES:
+                logger.info(f"Fulltext of {pdf_path} truncated at {FULLTEXT_MAX_PAGES} pages")
+                break
+            text = page.get_text("text", flags=FULLTEXT_FLAGS)
+            parts.append(text)
+            total += len(text)
+            if total >= FULLTEXT_MAX_CHARS:
+                logger.info(f"Fulltext of {pdf_path} truncated at {total} characters")
+                break
+    return '\n'.join(parts)[:FULLTEXT_MAX_CHARS]
+
+def extract_metadata_light(pdf_path: str) -> Dict[str, any]:
+    """只读取PDF文档信息字典（不解析页面内容），用于快速入库。
+    不填年份：creationDate 是文件生成日期而不是发表年份，年份由完整解析得到"""
+    result = {'title': None, 'authors': None, 'year': None}
+    try:
+        doc = fitz.open(pdf_path)
+        meta = doc.metadata or {}
+        doc.close()
+        result['title'] = meta.get('title') or None
+        result['authors'] = meta.get('author') or None
+    except Exception as e:
+        logger.error(f"Failed to read metadata from {pdf_path}: {e}")
+    return result
+
 def extract_metadata_from_pdf(pdf_path: str) -> Dict[str, any]:
     result = {
         'title': None, 'authors': None, 'year': None, 'venue': None,
         'doi': None, 'url': None, 'text': '', 'page_count': 0, 'char_count': 0
     }
     try:
+        # 元数据和正文共用同一次打开的文档
         doc = fitz.open(pdf_path)
         meta = doc.metadata or {}
         result['title'] = meta.get('title') or meta.get('subject')
         result['authors'] = meta.get('author')
-        text, total_pages = extract_text_from_pdf(pdf_path, max_pages=5)
+        text = _extract_pages_text(doc, 5)
         result['text'] = text
-        result['page_count'] = total_pages
+        result['page_count'] = len(doc)
+        doc.close()
         result['char_count'] = len(text.strip())
         
         doi_from_text = extract_doi_from_text(text)
@@ -77,7 +116,6 @@ def extract_metadata_from_pdf(pdf_path: str) -> Dict[str, any]:
         if not result['authors']:
             result['authors'] = extract_authors_from_text(text)
         result['venue'] = extract_venue_from_text(text)
-        doc.close()
     except Exception as e:
         logger.error(f"Failed to extract metadata from {pdf_path}: {e}")
         result['error'] = str(e)
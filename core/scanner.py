@@ -1,5 +1,7 @@
 import os
+import shutil
 import hashlib
+import mmap
 import logging
 import json
 from typing import List, Dict, Tuple, Optional
@@ -45,17 +47,54 @@ def is_path_excluded(path: str, root_dir: str, excluded_folders: List[str]) -> b
     return False
 
 
-def compute_sha256(file_path: str) -> str:
+# 超过该大小的文件用内存映射计算哈希，省去逐块读入时的用户态复制
+MMAP_HASH_THRESHOLD = 64 << 20
+
+def hash_file(file_path: str, stat: os.stat_result = None) -> Tuple[str, os.stat_result]:
+    """一次打开文件，同时得到SHA256和文件状态（fstat 不再额外查找路径）；
+    已有文件状态时可通过 stat 传入，不再重复获取"""
     sha256_hash = hashlib.sha256()
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            if stat is None:
+                stat = os.fstat(f.fileno())
+            if stat.st_size >= MMAP_HASH_THRESHOLD:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        sha256_hash.update(mm)
+                    return sha256_hash.hexdigest(), stat
+                except (OSError, ValueError) as e:
+                    logger.debug(f"mmap failed for {file_path}, falling back to chunked read: {e}")
+                    sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        return sha256_hash.hexdigest(), stat
     except Exception as e:
         logger.error(f"Failed to compute hash for {file_path}: {e}")
         raise
 
+def compute_sha256(file_path: str) -> str:
+    return hash_file(file_path)[0]
+
+def copy_file(src: str, dst: str, stat: os.stat_result = None) -> os.stat_result:
+    """
+    复制文件内容并保留修改时间，返回源文件状态
+    
+    Windows 下使用 CopyFileW 由系统完成复制；其他平台使用 shutil.copyfile，
+    在 Linux/macOS 上会走 sendfile/fcopyfile 内核零拷贝，避免 copy2 的 copystat 开销。
+    已有源文件状态时可通过 stat 传入，省去一次 stat 调用
+    """
+    if stat is None:
+        stat = os.stat(src)
+    if os.name == 'nt':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(src, dst, True):
+            return stat
+        logger.debug(f"CopyFileW failed for {src}, falling back to shutil.copyfile")
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    return stat
+
 def scan_directory(root_dir: str, extensions: tuple = ('.pdf', '.PDF', '.png', '.jpg', '.jpeg', '.bmp', '.tiff'), excluded_folders: List[str] = None) -> List[str]:
     """
     扫描目录中的文件
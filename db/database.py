@@ -7,20 +7,45 @@ from typing import Optional, List, Tuple, Dict, Any
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def remove_database_files(db_path: str):
+    """删除数据库文件及 WAL 模式下的 -wal/-shm 附属文件"""
+    for path in (db_path, db_path + '-wal', db_path + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+
+# 每个连接打开时执行的设置（journal_mode=WAL 写入数据库文件，只需在 init_db 中设置一次）：
+# WAL 模式下 synchronous=NORMAL 已能保证一致性，提交时不再每次 fsync；
+# cache_size 为 64MB 页缓存（负值单位为 KiB），扫描、备份、批量写入等在一个连接内的多语句操作不再反复读页
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+"""
+
 class Database:
     def __init__(self, db_path: str = "literature.db"):
         self.db_path = db_path
+        # get_all_* 的查询结果缓存，任何写入后清空
+        self._cache = {}
+        self._version = 0
         self.init_db()
     
     def get_connection(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        # timeout 即 busy_timeout：后台线程写入时等待而不是直接报 database is locked
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
     
     @contextmanager
-    def connection(self):
+    def connection(self, invalidate: bool = True):
+        """invalidate=False 用于只写入与查询缓存无关的表（如摘要缓存）"""
         conn = self.get_connection()
         try:
             yield conn
             conn.commit()
+            if invalidate and conn.total_changes:
+                self.invalidate_cache()
         except Exception as e:
             conn.rollback()
             logger.error(f"Database error: {e}")
@@ -28,7 +53,29 @@ class Database:
         finally:
             conn.close()
     
+    def invalidate_cache(self):
+        """清空查询缓存（绕过 connection() 直接写库后需手动调用）"""
+        self._version += 1
+        self._cache.clear()
+    
+    def _cached_query(self, key: str, sql: str) -> List[Dict[str, Any]]:
+        """返回新的列表，但其中的行字典与缓存共享，调用方只能读取；需要修改时先复制（如 update_row）"""
+        rows = self._cache.get(key)
+        if rows is None:
+            version = self._version
+            with self.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                rows = [dict(row) for row in conn.execute(sql).fetchall()]
+            # 查询期间其他线程写入过则不缓存，避免存入旧数据
+            if version == self._version:
+                self._cache[key] = rows
+        return list(rows)
+    
     def init_db(self):
+        # WAL 模式写入数据库文件后持久生效，读操作不再被写入阻塞
+        with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+        
         schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
         if os.path.exists(schema_path):
             with open(schema_path, 'r', encoding='utf-8') as f:
@@ -134,6 +181,9 @@ class Database:
                         logger.info(f"Added sort_order column to {table} table")
                     except Exception as e:
                         logger.warning(f"Failed to add sort_order column to {table}: {e}")
+                # 列表按 sort_order, updated_at 排序，复合索引让 SQLite 免去整表排序
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_sort ON {table}(sort_order, updated_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_year ON papers(year)")
             
             # 迁移：为papers表添加abstract和notes字段
             cursor = conn.execute("PRAGMA table_info(papers)")
@@ -149,17 +199,44 @@ class Database:
             logger.info("Database initialized")
     
     def get_all_papers(self) -> List[Dict[str, Any]]:
+        return self._cached_query('papers', """
+            SELECT p.*, f.path as file_path, f.filename as file_name, f.parse_status, f.sha256
+            FROM papers p
+            LEFT JOIN paper_files pf ON p.id = pf.paper_id
+            LEFT JOIN pdf_files f ON pf.pdf_file_id = f.id
+            ORDER BY p.sort_order ASC, p.updated_at DESC
+        """)
+    
+    def _search(self, key: str, sql: str, columns: List[str], text: str) -> List[Dict[str, Any]]:
+        """在指定列中做不区分大小写的子串匹配：已缓存全表时直接在内存中过滤，否则交给SQLite"""
+        rows = self._cache.get(key)
+        if rows is not None:
+            # 每行的搜索列预先拼接并转小写，随缓存一起失效；\0 分隔防止跨列匹配
+            blobs = self._cache.get(key + ':search')
+            if blobs is None:
+                blobs = ['\0'.join(str(row.get(col) or '') for col in columns).lower() for row in rows]
+                if self._cache.get(key) is rows:
+                    self._cache[key + ':search'] = blobs
+            text_lower = text.lower()
+            return [row for row, blob in zip(rows, blobs) if text_lower in blob]
+        
+        pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        where = ' OR '.join(f"{col} LIKE ? ESCAPE '\\'" for col in columns)
         with self.connection() as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT p.*, f.path as file_path, f.filename as file_name, f.parse_status, f.sha256
-                FROM papers p
-                LEFT JOIN paper_files pf ON p.id = pf.paper_id
-                LEFT JOIN pdf_files f ON pf.pdf_file_id = f.id
-                ORDER BY p.sort_order ASC, p.updated_at DESC
-            """)
+            cursor = conn.execute(sql.format(where=where), [pattern] * len(columns))
             return [dict(row) for row in cursor.fetchall()]
     
+    def search_papers(self, text: str) -> List[Dict[str, Any]]:
+        return self._search('papers', """
+            SELECT p.*, f.path as file_path, f.filename as file_name, f.parse_status, f.sha256
+            FROM papers p
+            LEFT JOIN paper_files pf ON p.id = pf.paper_id
+            LEFT JOIN pdf_files f ON pf.pdf_file_id = f.id
+            WHERE {where}
+            ORDER BY p.sort_order ASC, p.updated_at DESC
+        """, ['title', 'authors', 'doi', 'venue'], text)
+    
     def get_paper_by_id(self, paper_id: int) -> Optional[Dict[str, Any]]:
         with self.connection() as conn:
             conn.row_factory = sqlite3.Row
@@ -174,6 +251,20 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def get_pdf_by_sha256(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """按内容哈希查找PDF记录，优先返回已关联论文的记录（附带paper_id）"""
+        with self.connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("""
+                SELECT f.*, pf.paper_id FROM pdf_files f
+                LEFT JOIN paper_files pf ON f.id = pf.pdf_file_id
+                WHERE f.sha256 = ?
+                ORDER BY pf.paper_id IS NULL
+                LIMIT 1
+            """, (sha256,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
     def upsert_pdf_file(self, path: str, sha256: str, size: int, mtime: float, 
                         parse_status: str = 'pending', parse_error: str = None, filename: str = None) -> int:
         with self.connection() as conn:
@@ -262,25 +353,39 @@ class Database:
                     UPDATE pdf_files SET path = ?, last_scanned_at = strftime('%s', 'now')
                     WHERE path = ?
                 """, (new_path, old_path))
+            # 重命名不改变修改时间，已提取的摘要随路径迁移
+            conn.execute(
+                "UPDATE OR REPLACE pdf_abstract_cache SET path = ? WHERE path = ?",
+                (new_path, old_path)
+            )
     
     def delete_orphaned_papers(self):
         with self.connection() as conn:
             conn.execute("DELETE FROM papers WHERE id NOT IN (SELECT DISTINCT paper_id FROM paper_files)")
     
     def delete_paper(self, paper_id: int):
+        self.delete_papers([paper_id])
+    
+    def delete_papers(self, paper_ids: List[int]):
+        """批量删除论文，在同一事务中完成；不再被任何论文引用的PDF记录一并删除"""
+        params = [(paper_id,) for paper_id in paper_ids]
         with self.connection() as conn:
-            cursor = conn.execute("SELECT pdf_file_id FROM paper_files WHERE paper_id = ?", (paper_id,))
-            pdf_ids = [row[0] for row in cursor.fetchall()]
+            pdf_ids = set()
+            for param in params:
+                cursor = conn.execute("SELECT pdf_file_id FROM paper_files WHERE paper_id = ?", param)
+                pdf_ids.update(row[0] for row in cursor.fetchall())
             
-            conn.execute("DELETE FROM paper_files WHERE paper_id = ?", (paper_id,))
-            conn.execute("DELETE FROM papers WHERE id = ?", (paper_id,))
-            
-            for pdf_id in pdf_ids:
-                remaining = conn.execute(
-                    "SELECT COUNT(*) FROM paper_files WHERE pdf_file_id = ?", (pdf_id,)
-                ).fetchone()[0]
-                if remaining == 0:
-                    conn.execute("DELETE FROM pdf_files WHERE id = ?", (pdf_id,))
+            conn.executemany("DELETE FROM paper_files WHERE paper_id = ?", params)
+            conn.executemany("DELETE FROM papers WHERE id = ?", params)
+            pdf_params = [(pdf_id, pdf_id) for pdf_id in pdf_ids]
+            conn.executemany("""
+                DELETE FROM pdf_abstract_cache WHERE path = (SELECT path FROM pdf_files WHERE id = ?)
+                AND NOT EXISTS (SELECT 1 FROM paper_files WHERE pdf_file_id = ?)
+            """, pdf_params)
+            conn.executemany("""
+                DELETE FROM pdf_files WHERE id = ?
+                AND NOT EXISTS (SELECT 1 FROM paper_files WHERE pdf_file_id = ?)
+            """, pdf_params)
     
     def get_pending_files(self) -> List[Dict[str, Any]]:
         with self.connection() as conn:
@@ -362,11 +467,8 @@ class Database:
     # ========== Tag 相关方法 ==========
     
     def get_all_tags(self) -> List[Dict[str, Any]]:
-        """获取所有标签"""
-        with self.connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM tags ORDER BY name")
-            return [dict(row) for row in cursor.fetchall()]
+        """获取所有标签（结果缓存，任何写入后自动失效）"""
+        return self._cached_query('tags', "SELECT * FROM tags ORDER BY name")
     
     def get_or_create_tag(self, name: str, color: str = '#3498db') -> int:
         """获取或创建标签，返回标签ID"""
@@ -401,10 +503,14 @@ class Database:
     
     def add_tag_to_paper(self, paper_id: int, tag_id: int):
         """给论文添加标签"""
+        self.add_tag_to_papers([paper_id], tag_id)
+    
+    def add_tag_to_papers(self, paper_ids: List[int], tag_id: int):
+        """给多篇论文添加同一标签（同一事务）"""
         with self.connection() as conn:
-            conn.execute(
+            conn.executemany(
                 "INSERT OR IGNORE INTO paper_tags (paper_id, tag_id) VALUES (?, ?)",
-                (paper_id, tag_id)
+                [(paper_id, tag_id) for paper_id in paper_ids]
             )
     
     def remove_tag_from_paper(self, paper_id: int, tag_id: int):
@@ -415,6 +521,14 @@ class Database:
                 (paper_id, tag_id)
             )
     
+    def remove_tags_from_paper(self, paper_id: int, tag_ids: List[int]):
+        """从论文移除多个标签（同一事务）"""
+        with self.connection() as conn:
+            conn.executemany(
+                "DELETE FROM paper_tags WHERE paper_id = ? AND tag_id = ?",
+                [(paper_id, tag_id) for tag_id in tag_ids]
+            )
+    
     def set_paper_tags(self, paper_id: int, tag_names: List[str]):
         """设置论文的标签（替换所有现有标签）"""
         with self.connection() as conn:
@@ -527,10 +641,12 @@ class Database:
     
     def get_all_patents(self) -> List[Dict[str, Any]]:
         """获取所有专利"""
-        with self.connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM patents ORDER BY sort_order ASC, updated_at DESC")
-            return [dict(row) for row in cursor.fetchall()]
+        return self._cached_query('patents', "SELECT * FROM patents ORDER BY sort_order ASC, updated_at DESC")
+    
+    def search_patents(self, text: str) -> List[Dict[str, Any]]:
+        return self._search(
+            'patents', "SELECT * FROM patents WHERE {where} ORDER BY sort_order ASC, updated_at DESC",
+            ['title', 'patent_number', 'inventors', 'patentee', 'grant_number'], text)
     
     def get_patent_by_id(self, patent_id: int) -> Optional[Dict[str, Any]]:
         """根据ID获取专利"""
@@ -572,17 +688,23 @@ class Database:
     
     def delete_patent(self, patent_id: int):
         """删除专利"""
+        self.delete_patents([patent_id])
+    
+    def delete_patents(self, patent_ids: List[int]):
+        """批量删除专利（同一事务）"""
         with self.connection() as conn:
-            conn.execute("DELETE FROM patents WHERE id = ?", (patent_id,))
+            conn.executemany("DELETE FROM patents WHERE id = ?", [(i,) for i in patent_ids])
     
     # ========== Software 相关方法 ==========
     
     def get_all_softwares(self) -> List[Dict[str, Any]]:
         """获取所有软著"""
-        with self.connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM softwares ORDER BY sort_order ASC, updated_at DESC")
-            return [dict(row) for row in cursor.fetchall()]
+        return self._cached_query('softwares', "SELECT * FROM softwares ORDER BY sort_order ASC, updated_at DESC")
+    
+    def search_softwares(self, text: str) -> List[Dict[str, Any]]:
+        return self._search(
+            'softwares', "SELECT * FROM softwares WHERE {where} ORDER BY sort_order ASC, updated_at DESC",
+            ['software_name', 'title', 'registration_number', 'copyright_holder'], text)
     
     def get_software_by_id(self, software_id: int) -> Optional[Dict[str, Any]]:
         """根据ID获取软著"""
@@ -623,8 +745,12 @@ class Database:
     
     def delete_software(self, software_id: int):
         """删除软著"""
+        self.delete_softwares([software_id])
+    
+    def delete_softwares(self, software_ids: List[int]):
+        """批量删除软著（同一事务）"""
         with self.connection() as conn:
-            conn.execute("DELETE FROM softwares WHERE id = ?", (software_id,))
+            conn.executemany("DELETE FROM softwares WHERE id = ?", [(i,) for i in software_ids])
     
     # ========== Patent Tag 相关方法 ==========
     
@@ -831,6 +957,10 @@ class Database:
             conn.execute(f"UPDATE {table} SET sort_order = ? WHERE id = ?", (prev_order, item_id))
             conn.execute(f"UPDATE {table} SET sort_order = ? WHERE id = ?", (current_order, prev_item['id']))
         
+        # 同步内存中的sort_order，调用方可直接交换行而无需重新查询（替换为新字典，行字典可能与查询缓存共享）
+        current_data[current_idx] = {**current_data[current_idx], 'sort_order': prev_order}
+        current_data[current_idx - 1] = {**prev_item, 'sort_order': current_order}
+        
         return True
     
     def move_item_down(self, table: str, item_id: int, current_data: List[Dict]) -> bool:
@@ -864,6 +994,10 @@ class Database:
             conn.execute(f"UPDATE {table} SET sort_order = ? WHERE id = ?", (next_order, item_id))
             conn.execute(f"UPDATE {table} SET sort_order = ? WHERE id = ?", (current_order, next_item['id']))
         
+        # 同步内存中的sort_order，调用方可直接交换行而无需重新查询（替换为新字典，行字典可能与查询缓存共享）
+        current_data[current_idx] = {**current_data[current_idx], 'sort_order': next_order}
+        current_data[current_idx + 1] = {**next_item, 'sort_order': current_order}
+        
         return True
     
     def reset_sort_order(self, table: str):
@@ -926,11 +1060,32 @@ class Database:
     
     def save_fulltext(self, pdf_file_id: int, content: str):
         """保存PDF全文内容"""
+        self.save_fulltext_batch([(pdf_file_id, content)])
+    
+    def save_fulltext_batch(self, rows: List[Tuple[int, str]]):
+        """批量保存PDF全文内容（同一事务）；rows: [(pdf_file_id, content)]"""
         with self.connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO pdf_fulltext (pdf_file_id, content, indexed_at)
                 VALUES (?, ?, strftime('%s', 'now'))
-            """, (pdf_file_id, content))
+            """, rows)
+    
+    def get_cached_abstract(self, path: str, mtime: float) -> Optional[str]:
+        """获取已提取的摘要；文件修改时间不一致时视为过期，返回None"""
+        with self.connection() as conn:
+            row = conn.execute(
+                "SELECT abstract FROM pdf_abstract_cache WHERE path = ? AND mtime = ?",
+                (path, mtime)
+            ).fetchone()
+            return row[0] if row else None
+    
+    def set_cached_abstract(self, path: str, mtime: float, abstract: str):
+        """保存从PDF提取的摘要（摘要缓存不在查询缓存中，写入后无需清空）"""
+        with self.connection(invalidate=False) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pdf_abstract_cache (path, mtime, abstract) VALUES (?, ?, ?)",
+                (path, mtime, abstract)
+            )
     
     def get_fulltext(self, pdf_file_id: int) -> Optional[str]:
         """获取PDF全文内容"""
@@ -940,19 +1095,25 @@ class Database:
             return row[0] if row else None
     
     def search_fulltext(self, keyword: str) -> List[Dict[str, Any]]:
-        """全文搜索"""
+        """全文搜索：命中位置前后的摘录（snippet）在 SQLite 中截取，不返回整篇正文"""
+        pattern = '%' + keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
         with self.connection() as conn:
             conn.row_factory = sqlite3.Row
+            # LIKE 本身对 ASCII 不区分大小写，筛选时无需 LOWER；摘录位置先按原大小写查找，
+            # 只有正文中的命中与关键词大小写不同时才对整篇正文做 LOWER（COALESCE 按顺序求值）
             cursor = conn.execute("""
-                SELECT p.*, f.path as rel_path, f.filename, ft.content,
-                       INSTR(LOWER(ft.content), LOWER(?)) as match_pos
+                SELECT p.*, f.path as rel_path, f.filename,
+                       SUBSTR(ft.content,
+                              MAX(1, COALESCE(NULLIF(INSTR(ft.content, ?), 0),
+                                              INSTR(LOWER(ft.content), LOWER(?))) - 49),
+                              LENGTH(?) + 100) as snippet
                 FROM pdf_fulltext ft
                 JOIN pdf_files f ON ft.pdf_file_id = f.id
                 LEFT JOIN paper_files pf ON f.id = pf.pdf_file_id
                 LEFT JOIN papers p ON pf.paper_id = p.id
-                WHERE LOWER(ft.content) LIKE LOWER(?)
+                WHERE ft.content LIKE ? ESCAPE '\\'
                 ORDER BY p.year DESC, p.title
-            """, (keyword, f'%{keyword}%'))
+            """, (keyword, keyword, keyword, pattern))
             return [dict(row) for row in cursor.fetchall()]
     
     def get_unindexed_pdfs(self) -> List[Dict[str, Any]]:
@@ -172,6 +172,8 @@ CREATE TABLE IF NOT EXISTS software_tags (
 
 -- 索引
 CREATE INDEX IF NOT EXISTS idx_pdf_files_path ON pdf_files(path);
+-- 非唯一：同一内容的文件可能以多个路径存在（扫描到的副本），每个路径各占一行
+CREATE INDEX IF NOT EXISTS idx_pdf_files_sha256 ON pdf_files(sha256);
 CREATE INDEX IF NOT EXISTS idx_papers_doi ON papers(doi);
 CREATE INDEX IF NOT EXISTS idx_papers_title ON papers(title);
 CREATE INDEX IF NOT EXISTS idx_papers_publication_type ON papers(publication_type);
@@ -195,3 +197,10 @@ CREATE TABLE IF NOT EXISTS pdf_fulltext (
 );
 
 CREATE INDEX IF NOT EXISTS idx_pdf_fulltext_file ON pdf_fulltext(pdf_file_id);
+
+-- PDF摘要提取缓存（按文件路径和修改时间判断是否过期）
+CREATE TABLE IF NOT EXISTS pdf_abstract_cache (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    abstract TEXT
+);
@@ -3,8 +3,8 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLineEdit,
                                 QHBoxLayout, QMessageBox, QGroupBox, QListWidget,
                                 QListWidgetItem, QDialog, QInputDialog, QDialogButtonBox,
                                 QFileIconProvider, QStyle, QApplication)
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import Qt, Signal, QThread, QUrl
+from PySide6.QtGui import QIcon, QPixmap, QDesktopServices
 from typing import Dict
 import os
 import logging
@@ -485,10 +485,8 @@ class DetailPanel(QWidget):
         if file_path:
             abs_path = self.get_abs_path(file_path) if self.get_abs_path else file_path
             if abs_path and os.path.exists(abs_path):
-                try:
-                    os.startfile(abs_path)
-                except Exception as e:
-                    QMessageBox.warning(self, "错误", f"无法打开文件: {e}")
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                    QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
             else:
                 QMessageBox.warning(self, "错误", f"文件不存在: {abs_path}")
     
@@ -1,24 +1,39 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                 QTableView, QPushButton, QLabel, QLineEdit, 
                                 QFileDialog, QProgressBar, QMessageBox, QMenuBar,
-                                QStatusBar, QSplitter, QApplication, QInputDialog, QDialog, QGroupBox, QFormLayout, QComboBox, QHeaderView, QTableWidget, QTableWidgetItem, QTabWidget, QStackedWidget, QFrame, QListWidget, QListWidgetItem, QProgressDialog, QMenu, QTextEdit)
-from PySide6.QtCore import Qt, QThread, Signal, Slot
-from PySide6.QtGui import QFont, QAction, QKeySequence, QShortcut, QIcon
+                                QStatusBar, QSplitter, QApplication, QInputDialog, QDialog, QGroupBox, QFormLayout, QComboBox, QHeaderView, QTabWidget, QStackedWidget, QFrame, QListWidget, QListWidgetItem, QProgressDialog, QMenu, QTextEdit)
+from PySide6.QtCore import Qt, QSize, QThread, QTimer, QUrl, Signal, Slot
+from PySide6.QtGui import QFont, QAction, QKeySequence, QShortcut, QIcon, QDesktopServices
 from ui.table_model import PaperTableModel
+from ui.result_table_model import ResultTableModel
 from ui.patent_table_model import PatentTableModel
 from ui.software_table_model import SoftwareTableModel
 from ui.detail_panel import DetailPanel
 from ui.patent_detail_panel import PatentDetailPanel
 from ui.software_detail_panel import SoftwareDetailPanel
+import copy
 import os
 import sqlite3
 import subprocess
 import logging
 import json
 import re
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+# 图表用的 Qt 画布在启动时导入，打开统计图时不再付出首次导入的开销；后端不可用时不画图
+try:
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+except ImportError:
+    FigureCanvas = None
 
 # 设置中文字体
 import matplotlib.font_manager as fm
@@ -45,6 +60,350 @@ _chinese_font = set_chinese_font()
 
 logger = logging.getLogger(__name__)
 
+# 会议类刊物关键词（扫描时额外识别 CCS/NDSS 等安全会议简称）
+_VENUE_CONF_RE = re.compile(r'proceedings|conference|symposium', re.IGNORECASE)
+_SCAN_VENUE_CONF_RE = re.compile(r'proceedings|conference|ccs|ndss|symposium', re.IGNORECASE)
+# 从日期字符串中提取年份
+_YEAR_RE = re.compile(r'(\d{4})')
+_ILLEGAL_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+# 摘录片段中的换行、制表符统一显示为空格
+_NL_TO_SPACE = str.maketrans('\n\r\t', '   ')
+
+# orjson 为可选依赖：已安装时用它解析/序列化设置文件，否则使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PyMuPDF 在启动时导入一次，未安装时无法从PDF提取摘要
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+_PREFS_PATH = 'preferences.json'
+# preferences.json 解析结果缓存：{'key': (mtime_ns, size), 'data': 设置字典}
+_prefs_cache = {}
+
+
+def _load_preferences() -> Optional[Dict[str, Any]]:
+    """读取 preferences.json，文件未变化时返回缓存的副本；文件不存在或无法解析时返回 None"""
+    try:
+        stat = os.stat(_PREFS_PATH)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _prefs_cache.get('key') != key:
+        try:
+            with open(_PREFS_PATH, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        _prefs_cache.update(key=key, data=data)
+    return copy.deepcopy(_prefs_cache['data'])
+
+
+def _save_preferences(settings: Dict[str, Any]):
+    """写入 preferences.json：先写临时文件再原子替换，崩溃时不会留下半截的配置文件。
+    
+    偏好设置丢失可重新配置，不做 fsync，一次 write 加一次 rename 即可
+    """
+    tmp_path = _PREFS_PATH + '.tmp'
+    if orjson:
+        raw = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(settings, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, _PREFS_PATH)
+    stat = os.stat(_PREFS_PATH)
+    _prefs_cache.update(key=(stat.st_mtime_ns, stat.st_size), data=copy.deepcopy(settings))
+
+# 设置对话框测试 API/OCR 共用的 HTTP 会话（首次使用时创建），重复测试时复用已建立的连接
+_http_session = None
+
+
+def _get_http_session():
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        _http_session.mount('http://', adapter)
+        _http_session.mount('https://', adapter)
+    return _http_session
+
+def _venue_stats(papers) -> Dict[str, tuple]:
+    """按期刊一次遍历汇总：(文献数, 最大影响因子, 影响因子之和, 有影响因子的文献数)"""
+    stats = defaultdict(lambda: [0, None, 0, 0])
+    for paper in papers:
+        venue = (paper.get('venue') or '').strip()
+        if venue:
+            entry = stats[venue]
+            entry[0] += 1
+            impact_factor = paper.get('impact_factor')
+            # 0.0 是有效的影响因子，只有 None 表示缺失
+            if impact_factor is not None:
+                if entry[1] is None or impact_factor > entry[1]:
+                    entry[1] = impact_factor
+                entry[2] += impact_factor
+                entry[3] += 1
+    return {venue: tuple(entry) for venue, entry in stats.items()}
+
+def _year_counts(papers) -> List[tuple]:
+    """按年份计数，年份从新到旧排列"""
+    return sorted(Counter(paper['year'] for paper in papers if paper.get('year')).items(), reverse=True)
+
+# 右键菜单按条目类型读取的字段：(文件路径, 标题)
+_ITEM_FIELDS = {
+    'paper': ('file_path', 'title'),
+    'patent': ('file_path', 'title'),
+    'software': ('file_path', 'software_name'),
+}
+
+class PaperMetadataThread(QThread):
+    """解析拖入PDF的完整元数据并查询DOI，结果写回已入库的论文记录"""
+    status = Signal(str)
+    
+    def __init__(self, db, jobs):
+        super().__init__()
+        self.db = db
+        # (paper_id, pdf_id, pdf_path)
+        self.jobs = jobs
+    
+    def run(self):
+        from core.extractor import extract_metadata_from_pdf, needs_ocr, generate_bibtex_key
+        from core.resolver import resolve_doi, detect_publication_type
+        
+        total = len(self.jobs)
+        for i, (paper_id, pdf_id, pdf_path) in enumerate(self.jobs):
+            # 数据库被关闭或重建时停止，不再写入旧库
+            if self.isInterruptionRequested():
+                return
+            self.status.emit(f"解析 {i+1}/{total}: {os.path.basename(pdf_path)}")
+            try:
+                meta = extract_metadata_from_pdf(pdf_path)
+                
+                if needs_ocr(meta.get('text', '')):
+                    fields = {
+                        'title': meta.get('title') or os.path.basename(pdf_path),
+                        'authors': meta.get('authors') or '',
+                        'year': meta.get('year'),
+                        'venue': meta.get('venue') or '',
+                        'url': meta.get('url') or '',
+                    }
+                    if meta.get('doi'):
+                        fields['doi'] = meta['doi']
+                    self._update_paper(paper_id, pdf_id, fields)
+                    self.db.update_pdf_status(pdf_id, 'needs_ocr', 'Text too short')
+                    continue
+                
+                doi, conf, source, full_meta = resolve_doi({
+                    'title': meta.get('title'),
+                    'authors': meta.get('authors'),
+                    'year': meta.get('year'),
+                    'venue': meta.get('venue'),
+                    'doi': meta.get('doi')
+                })
+                
+                final_title = full_meta.get('title') or meta.get('title') or os.path.basename(pdf_path)
+                final_authors = full_meta.get('authors') or meta.get('authors') or ''
+                final_year = full_meta.get('year') or meta.get('year')
+                final_venue = full_meta.get('venue') or meta.get('venue') or ''
+                final_url = full_meta.get('url') or meta.get('url') or ''
+                
+                entry_type = 'inproceedings' if _VENUE_CONF_RE.search(final_venue) else 'article'
+                
+                fields = {
+                    'title': final_title,
+                    'authors': final_authors,
+                    'year': final_year,
+                    'venue': final_venue,
+                    'url': final_url,
+                    'entry_type': entry_type,
+                    'publication_type': detect_publication_type(final_venue),
+                    'bibtex_key': generate_bibtex_key({
+                        'authors': final_authors,
+                        'year': final_year,
+                        'title': final_title
+                    }),
+                    'confidence': conf,
+                    'source': source,
+                }
+                if doi:
+                    fields['doi'] = doi
+                self._update_paper(paper_id, pdf_id, fields)
+                
+                status = 'success' if conf >= 80 else ('needs_review' if conf > 0 else 'needs_ocr')
+                self.db.update_pdf_status(pdf_id, status)
+            except Exception as e:
+                logger.error(f"Failed to parse dropped file {pdf_path}: {e}")
+                self.db.update_pdf_status(pdf_id, 'failed', str(e))
+        
+        self.status.emit(f"解析完成 {total} 个文件")
+    
+    def _update_paper(self, paper_id, pdf_id, fields):
+        """写回论文信息；DOI 已属于其他论文时改为关联到该论文"""
+        try:
+            self.db.update_paper(paper_id, **fields)
+        except sqlite3.IntegrityError:
+            with self.db.connection() as conn:
+                row = conn.execute("SELECT id FROM papers WHERE doi = ?", (fields['doi'],)).fetchone()
+            if not row:
+                raise
+            self.db.link_paper_pdf(row[0], pdf_id)
+            self.db.delete_paper(paper_id)
+
+class FulltextIndexThread(QThread):
+    """在后台建立全文索引：PDF文本提取分发到进程池，按核数并行"""
+    progress = Signal(int, str)
+    finished = Signal(int, int)
+    
+    # 每积累这么多篇全文提交一次，减少事务提交次数
+    SAVE_BATCH_SIZE = 32
+    
+    def __init__(self, db, jobs):
+        super().__init__()
+        self.db = db
+        # jobs: [(pdf_id, abs_path, 显示名)]
+        self.jobs = jobs
+    
+    def run(self):
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from core.extractor import extract_fulltext
+        
+        indexed = 0
+        failed = 0
+        pending = []
+        # 不指定 max_workers：默认按核数创建进程，并在 Windows 上限制为 61（超过会引发 ValueError）
+        with ProcessPoolExecutor() as executor:
+            futures = {executor.submit(extract_fulltext, path): (pdf_id, path, name)
+                       for pdf_id, path, name in self.jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.isInterruptionRequested():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                pdf_id, path, name = futures[future]
+                try:
+                    content = future.result()
+                    if content.strip():
+                        pending.append((pdf_id, content))
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"索引失败 {path}: {e}")
+                if len(pending) >= self.SAVE_BATCH_SIZE:
+                    indexed, failed = self._save(pending, indexed, failed)
+                self.progress.emit(done, name)
+        indexed, failed = self._save(pending, indexed, failed)
+        self.finished.emit(indexed, failed)
+    
+    def _save(self, pending, indexed, failed):
+        """写入积累的全文并清空列表，返回更新后的计数"""
+        if pending:
+            try:
+                self.db.save_fulltext_batch(pending)
+                indexed += len(pending)
+            except Exception as e:
+                failed += len(pending)
+                logger.error(f"保存全文索引失败: {e}")
+            pending.clear()
+        return indexed, failed
+
+
+class BackupThread(QThread):
+    """在后台备份或恢复数据库，避免大库操作时界面卡住"""
+    finished = Signal(bool, str)
+    progress = Signal(int)
+    
+    # 二进制备份/恢复每步复制的页数：每步之间释放锁，内存占用也限定在一步之内
+    BACKUP_STEP_PAGES = 1024
+    
+    def __init__(self, db, path, restore=False, sql_format=False):
+        super().__init__()
+        self.db = db
+        self.path = path
+        self.restore = restore
+        self.sql_format = sql_format
+    
+    def run(self):
+        try:
+            if self.restore:
+                self._restore()
+            else:
+                self._backup()
+            self.finished.emit(True, self.path)
+        except Exception as e:
+            logger.error(f"{'Restore' if self.restore else 'Backup'} failed: {e}")
+            self.finished.emit(False, str(e))
+    
+    def _backup(self):
+        from datetime import datetime
+        # 线程内使用独立的连接
+        conn = self.db.get_connection()
+        try:
+            if self.sql_format:
+                # 文本格式：便于跨版本迁移，由 iterdump 生成建表与插入语句
+                with open(self.path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write("-- 数据库备份\n")
+                    f.write(f"-- 备份时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write("-- =====================\n\n")
+                    f.writelines(f"{line}\n" for line in conn.iterdump())
+            else:
+                # 二进制格式：SQLite 在线备份，按页复制，得到一致的快照
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                dest = sqlite3.connect(self.path)
+                try:
+                    conn.backup(dest, pages=self.BACKUP_STEP_PAGES, progress=self._on_backup_progress)
+                finally:
+                    dest.close()
+        finally:
+            conn.close()
+    
+    def _restore(self):
+        if self.path.lower().endswith('.sql'):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                script = f.read().rstrip()
+            
+            # iterdump 生成的脚本自带 BEGIN/COMMIT，去掉后与删表一起放进同一个事务
+            # （直接在字符串上处理，不按行拆分，避免大备份在内存中多复制几份）
+            if script.endswith('\nCOMMIT;') and 'BEGIN TRANSACTION;\n' in script:
+                script = script[:-len('COMMIT;')].replace('BEGIN TRANSACTION;\n', '', 1)
+            
+            conn = self.db.get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = [row[0] for row in cursor.fetchall() if not row[0].startswith('sqlite_')]
+                # 表名来自 sqlite_master，按SQL标识符规则加引号并转义其中的双引号
+                drops = ''.join('DROP TABLE IF EXISTS "{}";\n'.format(table.replace('"', '""')) for table in tables)
+                
+                # 整个恢复是一个事务：失败时回滚，当前数据保持不变
+                conn.execute("PRAGMA synchronous=OFF")
+                try:
+                    cursor.executescript(f"BEGIN IMMEDIATE;\n{drops}{script}\nCOMMIT;")
+                except Exception:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    raise
+                conn.execute("PRAGMA optimize")
+            finally:
+                conn.close()
+        else:
+            # 二进制备份：用在线备份接口把备份文件整体复制回当前数据库
+            src = sqlite3.connect(self.path)
+            conn = self.db.get_connection()
+            try:
+                src.backup(conn, pages=self.BACKUP_STEP_PAGES, progress=self._on_backup_progress)
+            finally:
+                src.close()
+                conn.close()
+        self.db.invalidate_cache()
+    
+    def _on_backup_progress(self, status, remaining, total):
+        if total:
+            self.progress.emit(int((total - remaining) / total * 100))
+
 class ScanThread(QThread):
     finished = Signal(list)
     progress = Signal(int)
@@ -119,6 +478,9 @@ class ScanThread(QThread):
             updated = []
             
             for i, path in enumerate(files):
+                # 退出程序时在当前文件处理完后停止
+                if self.isInterruptionRequested():
+                    break
                 self.status.emit(f"扫描 {i+1}/{total}: {os.path.basename(path)}")
                 self.progress.emit(int((i+1)/total*100))
                 
@@ -258,10 +620,7 @@ class ScanThread(QThread):
                     final_venue = full_meta.get('venue') or meta.get('venue')
                     final_url = full_meta.get('url') or meta.get('url')
                     
-                    entry_type = 'article'
-                    venue_lower = (final_venue or '').lower()
-                    if any(kw in venue_lower for kw in ['proceedings', 'conference', 'ccs', 'ndss', 'symposium']):
-                        entry_type = 'inproceedings'
+                    entry_type = 'inproceedings' if _SCAN_VENUE_CONF_RE.search(final_venue or '') else 'article'
                     
                     from core.resolver import detect_publication_type
                     publication_type = detect_publication_type(final_venue)
@@ -299,6 +658,34 @@ class ScanThread(QThread):
                                     filename=info.get('filename'))
 
 
+def _format_citation(item_type: str, item: Dict[str, Any]) -> str:
+    """按条目类型生成 GB/T 7714 引用"""
+    if item_type == 'paper':
+        from core.bibtex import export_gbt7714
+        return export_gbt7714([item])
+    from core.export import format_patent_gbt7714, format_software_gbt7714
+    if item_type == 'patent':
+        return format_patent_gbt7714(item)
+    return format_software_gbt7714(item)
+
+
+@dataclass
+class TabContext:
+    """标签页上下文：论文/专利/软著标签页各自的视图、模型与数据访问方法"""
+    view: QTableView
+    model: Any
+    table: str
+    get_item: Callable[[int], Optional[Dict[str, Any]]]
+    get_all: Callable[[], List[Dict[str, Any]]]
+    search: Callable[[str], List[Dict[str, Any]]]
+    get_by_tag_name: Callable[[str], List[Dict[str, Any]]]
+    get_tags: Callable[[], List[Dict[str, Any]]]
+    refresh: Callable[[], None]
+    year_field: str
+    unit: str
+    format_citation: Callable[[Dict[str, Any]], str]
+
+
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径，兼容打包后的环境"""
     import sys
@@ -313,6 +700,16 @@ class MainWindow(QMainWindow):
         self.db = db
         self.db_path = db_path
         self.root_dir = os.path.dirname(os.path.abspath(db_path))
+        # 正在后台解析拖入PDF的线程
+        self._metadata_threads = []
+        # dragEnterEvent 中解析出的PDF路径
+        self._pending_drop = []
+        # 正在运行的备份/恢复线程
+        self._backup_thread = None
+        self._fulltext_thread = None
+        self.scan_thread = None
+        # 统计对话框共用的汇总结果：(名称, 论文模型版本) -> 结果
+        self._stats_cache = {}
         
         # 设置窗口图标（兼容打包后环境）
         icon_path = get_resource_path("resources/icons/app.png")
@@ -331,9 +728,7 @@ class MainWindow(QMainWindow):
     def _get_abs_path(self, rel_path):
         if not rel_path:
             return None
-        if os.path.isabs(rel_path):
-            return rel_path
-        return os.path.join(self.root_dir, rel_path)
+        return _resolve_pdf_path(self.root_dir, rel_path)
     
     def _setup_ui(self):
         db_name = os.path.basename(self.db_path)
@@ -359,6 +754,11 @@ class MainWindow(QMainWindow):
         self.search_edit.setPlaceholderText("搜索...")
         self.search_edit.setFixedWidth(300)
         toolbar.addWidget(self.search_edit)
+        # 输入停止 200ms 后再执行搜索，合并连续按键
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._do_search)
         
         spacer2 = QWidget()
         spacer2.setFixedWidth(10)
@@ -366,6 +766,7 @@ class MainWindow(QMainWindow):
         
         self.tag_filter = QComboBox()
         self.tag_filter.addItem("全部标签")
+        self._tag_filter_names = ()
         self.tag_filter.setMinimumWidth(120)
         toolbar.addWidget(self.tag_filter)
         
@@ -419,7 +820,9 @@ class MainWindow(QMainWindow):
         header = self.paper_table_view.horizontalHeader()
         header.setVisible(True)
         header.setFixedHeight(30)
+        # 固定行高：行数较多时视图无需逐行计算高度
         vheader = self.paper_table_view.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
         vheader.setDefaultSectionSize(22)
         vheader.setVisible(False)
         self.paper_table_view.setSortingEnabled(True)
@@ -447,6 +850,7 @@ class MainWindow(QMainWindow):
         header.setVisible(True)
         header.setFixedHeight(30)
         vheader = self.patent_table_view.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
         vheader.setDefaultSectionSize(22)
         vheader.setVisible(False)
         self.patent_table_view.setSortingEnabled(True)
@@ -474,6 +878,7 @@ class MainWindow(QMainWindow):
         header.setVisible(True)
         header.setFixedHeight(30)
         vheader = self.software_table_view.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
         vheader.setDefaultSectionSize(22)
         vheader.setVisible(False)
         self.software_table_view.setSortingEnabled(True)
@@ -523,6 +928,37 @@ class MainWindow(QMainWindow):
         splitter.setSizes([950, 450])
         
         layout.addWidget(splitter)
+        
+        # 各标签页的视图/模型/数据访问方法，按标签页索引分派
+        self._tabs = [
+            TabContext(
+                view=self.paper_table_view, model=self.paper_model, table='papers',
+                get_item=self.paper_model.get_paper_at,
+                get_all=lambda: self.db.get_all_papers(),
+                search=lambda text: self.db.search_papers(text),
+                get_by_tag_name=lambda tag: self.db.get_papers_by_tag_name(tag),
+                get_tags=lambda: self.db.get_all_tags(),
+                refresh=self.refresh_table, year_field='year', unit='篇',
+                format_citation=partial(_format_citation, 'paper')),
+            TabContext(
+                view=self.patent_table_view, model=self.patent_model, table='patents',
+                get_item=self.patent_model.get_patent_at,
+                get_all=lambda: self.db.get_all_patents(),
+                search=lambda text: self.db.search_patents(text),
+                get_by_tag_name=lambda tag: self.db.get_patents_by_tag_name(tag),
+                get_tags=lambda: self.db.get_all_patent_tags(),
+                refresh=self.refresh_patents, year_field='grant_date', unit='项',
+                format_citation=partial(_format_citation, 'patent')),
+            TabContext(
+                view=self.software_table_view, model=self.software_model, table='softwares',
+                get_item=self.software_model.get_software_at,
+                get_all=lambda: self.db.get_all_softwares(),
+                search=lambda text: self.db.search_softwares(text),
+                get_by_tag_name=lambda tag: self.db.get_softwares_by_tag_name(tag),
+                get_tags=lambda: self.db.get_all_software_tags(),
+                refresh=self.refresh_softwares, year_field='development_date', unit='个',
+                format_citation=partial(_format_citation, 'software')),
+        ]
     
     def _setup_menu(self):
         menubar = self.menuBar()
@@ -544,14 +980,14 @@ class MainWindow(QMainWindow):
         close_db_action.triggered.connect(self._close_database)
         file_menu.addAction(close_db_action)
         
-        refresh_db_action = QAction("刷新数据库\tF5", self)
-        refresh_db_action.setShortcut(QKeySequence("F5"))
-        refresh_db_action.triggered.connect(self._refresh_database)
-        file_menu.addAction(refresh_db_action)
+        self.refresh_db_action = QAction("刷新数据库\tF5", self)
+        self.refresh_db_action.setShortcut(QKeySequence("F5"))
+        self.refresh_db_action.triggered.connect(self._refresh_database)
+        file_menu.addAction(self.refresh_db_action)
         
-        rebuild_db_action = QAction("重建数据库", self)
-        rebuild_db_action.triggered.connect(self._rebuild_database)
-        file_menu.addAction(rebuild_db_action)
+        self.rebuild_db_action = QAction("重建数据库", self)
+        self.rebuild_db_action.triggered.connect(self._rebuild_database)
+        file_menu.addAction(self.rebuild_db_action)
         
         file_menu.addSeparator()
         
@@ -705,7 +1141,7 @@ class MainWindow(QMainWindow):
         self.search_edit.textChanged.connect(self._on_search)
         self.tag_filter.currentTextChanged.connect(self._on_tag_filter)
         self.year_filter.currentTextChanged.connect(self._on_year_filter)
-        self.detail_panel.data_changed.connect(lambda p: self.refresh_table())
+        self.detail_panel.data_changed.connect(self._on_paper_data_changed)
         self.patent_detail_panel.data_changed.connect(lambda p: self.refresh_patents())
         self.software_detail_panel.data_changed.connect(lambda p: self.refresh_softwares())
         self.paper_table_view.selectionModel().currentChanged.connect(self._on_paper_current_changed)
@@ -717,48 +1153,59 @@ class MainWindow(QMainWindow):
         
         # 快捷键（菜单中已定义的快捷键不需要重复定义）
         QShortcut(QKeySequence("Ctrl+F"), self, self._focus_search)
-        QShortcut(QKeySequence("Ctrl+1"), self, lambda: self.tab_widget.setCurrentIndex(0))
-        QShortcut(QKeySequence("Ctrl+2"), self, lambda: self.tab_widget.setCurrentIndex(1))
-        QShortcut(QKeySequence("Ctrl+3"), self, lambda: self.tab_widget.setCurrentIndex(2))
-        QShortcut(QKeySequence("Return"), self, self._open_selected_file)
-        QShortcut(QKeySequence("Enter"), self, self._open_selected_file)
-        QShortcut(QKeySequence("Ctrl+C"), self, self._copy_selected_citation)
+        for i in range(self.tab_widget.count()):
+            QShortcut(QKeySequence(f"Ctrl+{i + 1}"), self, partial(self.tab_widget.setCurrentIndex, i))
         QShortcut(QKeySequence("Ctrl+E"), self, self._open_selected_folder)
         QShortcut(QKeySequence("Ctrl+S"), self, self._save_current_detail)
         QShortcut(QKeySequence("Escape"), self, self._clear_search)
-        QShortcut(QKeySequence("Ctrl+Up"), self, self._move_item_up)
-        QShortcut(QKeySequence("Ctrl+Down"), self, self._move_item_down)
+        
+        # 作用于表格选中行的快捷键只在焦点位于表格区域时生效，避免与详情面板/搜索框的输入冲突
+        for key, slot in (("Return", self._open_selected_file),
+                          ("Enter", self._open_selected_file),
+                          ("Ctrl+C", self._copy_selected_citation),
+                          ("Ctrl+Up", self._move_item_up),
+                          ("Ctrl+Down", self._move_item_down)):
+            shortcut = QShortcut(QKeySequence(key), self.tab_widget, slot)
+            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+    
+    @staticmethod
+    def _pdf_paths_from_mime(mime_data):
+        """从拖拽数据中取出所有PDF文件路径"""
+        if not mime_data.hasUrls():
+            return []
+        paths = (url.toLocalFile() for url in mime_data.urls())
+        return [path for path in paths if path.lower().endswith('.pdf')]
     
     def dragEnterEvent(self, event):
         """拖拽进入事件"""
-        if event.mimeData().hasUrls():
-            # 检查是否有PDF文件
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
+        # 解析结果留给 dropEvent 使用，避免重复遍历URL
+        self._pending_drop = self._pdf_paths_from_mime(event.mimeData())
+        if self._pending_drop:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
     
     def dragMoveEvent(self, event):
         """拖拽移动事件"""
-        if event.mimeData().hasUrls():
+        if self._pending_drop:
             event.acceptProposedAction()
         else:
             event.ignore()
     
+    def dragLeaveEvent(self, event):
+        """拖拽离开事件"""
+        self._pending_drop = []
+    
     def dropEvent(self, event):
         """拖拽放下事件"""
+        pdf_files = self._pending_drop or self._pdf_paths_from_mime(event.mimeData())
+        self._pending_drop = []
+        
         if not self.db or not self.root_dir:
             QMessageBox.warning(self, "警告", "请先打开或创建数据库")
             event.ignore()
             return
         
-        pdf_files = []
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith('.pdf'):
-                pdf_files.append(file_path)
-        
         if not pdf_files:
             event.ignore()
             return
@@ -770,43 +1217,59 @@ class MainWindow(QMainWindow):
     
     def _process_dropped_files(self, pdf_files):
         """处理拖入的PDF文件"""
-        import shutil
-        import hashlib
+        from core.scanner import hash_file, copy_file
         
         current_tab = self.tab_widget.currentIndex()
         added_count = 0
+        skipped_count = 0
         errors = []
+        paper_jobs = []
         
         for pdf_path in pdf_files:
             try:
-                filename = os.path.basename(pdf_path)
-                dest_path = os.path.join(self.root_dir, filename)
-                
-                # 如果文件已存在，添加数字后缀
-                if os.path.exists(dest_path) and os.path.abspath(pdf_path) != os.path.abspath(dest_path):
-                    base, ext = os.path.splitext(filename)
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        dest_path = os.path.join(self.root_dir, f"{base}_{counter}{ext}")
-                        counter += 1
-                    filename = os.path.basename(dest_path)
-                
-                # 如果源文件不在根目录，则复制
-                if os.path.abspath(pdf_path) != os.path.abspath(dest_path):
-                    shutil.copy2(pdf_path, dest_path)
-                    self.statusBar().showMessage(f"已复制: {filename}")
+                # 先对源文件计算哈希，已入库的相同PDF无需再复制和解析
+                sha256, stat = hash_file(pdf_path)
+                existing_abs_path = None
+                if current_tab == 0:
+                    existing = self.db.get_pdf_by_sha256(sha256)
+                    if existing:
+                        existing_abs_path = self._get_abs_path(existing['path'])
+                        if not os.path.exists(existing_abs_path):
+                            existing_abs_path = None
+                        elif existing.get('paper_id'):
+                            logger.info(f"Skip duplicate dropped file: {pdf_path} -> {existing['path']}")
+                            skipped_count += 1
+                            continue
                 
-                # 计算文件信息
-                with open(dest_path, 'rb') as f:
-                    sha256 = hashlib.sha256(f.read()).hexdigest()
+                if existing_abs_path:
+                    # 内容相同的文件已在库中但未关联论文，直接复用
+                    dest_path = existing_abs_path
+                    stat = os.stat(dest_path)
+                else:
+                    filename = os.path.basename(pdf_path)
+                    dest_path = os.path.join(self.root_dir, filename)
+                    
+                    # 如果文件已存在，添加数字后缀
+                    if os.path.exists(dest_path) and os.path.abspath(pdf_path) != os.path.abspath(dest_path):
+                        base, ext = os.path.splitext(filename)
+                        counter = 1
+                        while os.path.exists(dest_path):
+                            dest_path = os.path.join(self.root_dir, f"{base}_{counter}{ext}")
+                            counter += 1
+                        filename = os.path.basename(dest_path)
+                    
+                    # 如果源文件不在根目录，则复制
+                    if os.path.abspath(pdf_path) != os.path.abspath(dest_path):
+                        copy_file(pdf_path, dest_path, stat)
+                        self.statusBar().showMessage(f"已复制: {filename}")
                 
-                stat = os.stat(dest_path)
                 rel_path = os.path.relpath(dest_path, self.root_dir)
                 
                 # 根据当前标签页处理
                 if current_tab == 0:
-                    # 论文标签页 - 解析PDF并添加论文
-                    self._add_paper_from_pdf(dest_path, rel_path, sha256, stat)
+                    # 论文标签页 - 先快速添加论文，完整解析在后台进行
+                    paper_id, pdf_id = self._add_paper_from_pdf(dest_path, rel_path, sha256, stat)
+                    paper_jobs.append((paper_id, pdf_id, dest_path))
                 elif current_tab == 1:
                     # 专利标签页 - 尝试识别专利证书
                     self._add_patent_from_pdf(dest_path, rel_path)
@@ -821,17 +1284,16 @@ class MainWindow(QMainWindow):
                 errors.append(f"{os.path.basename(pdf_path)}: {str(e)}")
         
         # 刷新表格
-        if current_tab == 0:
-            self.refresh_table()
-        elif current_tab == 1:
-            self.refresh_patents()
-        elif current_tab == 2:
-            self.refresh_softwares()
+        self._tabs[current_tab].refresh()
+        if paper_jobs:
+            self._start_paper_metadata_thread(paper_jobs)
         
         # 显示结果
-        if added_count > 0:
+        if added_count > 0 or skipped_count > 0:
             tab_names = ["论文", "专利", "软著"]
             msg = f"已添加 {added_count} 个{tab_names[current_tab]}文件"
+            if skipped_count:
+                msg += f"\n{skipped_count} 个文件已在库中，已跳过"
             if errors:
                 msg += f"\n\n{len(errors)} 个文件处理失败"
             QMessageBox.information(self, "完成", msg)
@@ -839,12 +1301,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "错误", f"所有文件处理失败:\n" + "\n".join(errors[:5]))
     
     def _add_paper_from_pdf(self, pdf_path, rel_path, sha256, stat):
-        """从PDF添加论文"""
-        from core.extractor import extract_metadata_from_pdf, needs_ocr, generate_bibtex_key
-        from core.resolver import resolve_doi, detect_publication_type
+        """从PDF添加论文：先按文档信息字典快速入库，完整解析和DOI查询留给后台线程"""
+        from core.extractor import extract_metadata_light
         
-        # 提取元数据
-        meta = extract_metadata_from_pdf(pdf_path)
+        meta = extract_metadata_light(pdf_path)
         
         # 添加PDF记录
         pdf_id = self.db.upsert_pdf_file(
@@ -856,69 +1316,53 @@ class MainWindow(QMainWindow):
             filename=os.path.basename(pdf_path)
         )
         
-        # 尝试解析DOI
-        if not needs_ocr(meta.get('text', '')):
-            doi, conf, source, full_meta = resolve_doi({
-                'title': meta.get('title'),
-                'authors': meta.get('authors'),
-                'year': meta.get('year'),
-                'venue': meta.get('venue'),
-                'doi': meta.get('doi')
-            })
-            
-            final_title = full_meta.get('title') or meta.get('title') or os.path.basename(pdf_path)
-            final_authors = full_meta.get('authors') or meta.get('authors') or ''
-            final_year = full_meta.get('year') or meta.get('year')
-            final_venue = full_meta.get('venue') or meta.get('venue') or ''
-            final_url = full_meta.get('url') or meta.get('url') or ''
-            
-            entry_type = 'article'
-            venue_lower = (final_venue or '').lower()
-            if any(kw in venue_lower for kw in ['proceedings', 'conference', 'symposium']):
-                entry_type = 'inproceedings'
-            
-            publication_type = detect_publication_type(final_venue)
-            
-            bibtex_key = generate_bibtex_key({
-                'authors': final_authors,
-                'year': final_year,
-                'title': final_title
-            })
-            
-            paper_id = self.db.upsert_paper(
-                title=final_title,
-                authors=final_authors,
-                year=final_year,
-                venue=final_venue,
-                doi=doi,
-                url=final_url,
-                entry_type=entry_type,
-                publication_type=publication_type,
-                bibtex_key=bibtex_key,
-                confidence=conf,
-                source=source
-            )
-            
-            status = 'success' if conf >= 80 else ('needs_review' if conf > 0 else 'needs_ocr')
-            self.db.update_pdf_status(pdf_id, status)
-        else:
-            # 需要OCR
-            paper_id = self.db.upsert_paper(
-                title=meta.get('title') or os.path.basename(pdf_path),
-                authors=meta.get('authors') or '',
-                year=meta.get('year'),
-                venue=meta.get('venue') or '',
-                doi=meta.get('doi') or '',
-                url=meta.get('url') or '',
-                entry_type='article',
-                publication_type='other',
-                bibtex_key='',
-                confidence=0,
-                source='pdf'
-            )
-            self.db.update_pdf_status(pdf_id, 'needs_ocr', 'Text too short')
-        
+        paper_id = self.db.upsert_paper(
+            title=meta.get('title') or os.path.basename(pdf_path),
+            authors=meta.get('authors') or '',
+            year=meta.get('year'),
+            confidence=0,
+            source='pdf'
+        )
         self.db.link_paper_pdf(paper_id, pdf_id)
+        return paper_id, pdf_id
+    
+    def _start_paper_metadata_thread(self, jobs):
+        """后台解析新添加论文的完整元数据"""
+        thread = PaperMetadataThread(self.db, jobs)
+        thread.status.connect(self.statusBar().showMessage)
+        thread.finished.connect(lambda: self._on_paper_metadata_finished(thread))
+        self._metadata_threads.append(thread)
+        thread.start()
+    
+    def _on_paper_metadata_finished(self, thread):
+        self._metadata_threads.remove(thread)
+        thread.deleteLater()
+        # 期间数据库已关闭或切换时，结果属于旧库，不再刷新
+        if thread.db is not self.db:
+            return
+        # 增量刷新，保留当前选中行
+        if self.tab_widget.currentIndex() == 0:
+            self.refresh_table()
+    
+    def _stop_paper_metadata_threads(self):
+        """关闭或重建数据库前停止后台元数据解析，等待当前文件处理完"""
+        for thread in self._metadata_threads:
+            thread.requestInterruption()
+        for thread in self._metadata_threads:
+            thread.wait()
+    
+    def closeEvent(self, event):
+        # 退出前停止后台线程并等待其结束，避免销毁运行中的 QThread、留下写了一半的索引或备份；
+        # 扫描、索引、元数据解析在当前文件处理完后停止，备份/恢复须完整结束
+        self.statusBar().showMessage("正在等待后台任务结束...")
+        running = [t for t in (self.scan_thread, self._fulltext_thread, self._backup_thread)
+                   if t and t.isRunning()]
+        for thread in running:
+            thread.requestInterruption()
+        self._stop_paper_metadata_threads()
+        for thread in running:
+            thread.wait()
+        super().closeEvent(event)
     
     def _add_patent_from_pdf(self, pdf_path, rel_path):
         """从PDF添加专利"""
@@ -988,7 +1432,8 @@ class MainWindow(QMainWindow):
     
     def _clear_search(self):
         self.search_edit.clear()
-        self._on_search_changed('')
+        self._search_timer.stop()
+        self._do_search()
     
     def _save_current_detail(self):
         """Ctrl+S: 保存当前详情面板的修改"""
@@ -1005,183 +1450,79 @@ class MainWindow(QMainWindow):
         if not self.db:
             return
         
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            indexes = self.paper_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row == 0:
-                return  # 已经在最上面
-            
-            item_id = self.paper_model._data[row]['id']
-            if self.db.move_item_up('papers', item_id, self.paper_model._data):
-                # 刷新数据
-                papers = self.db.get_all_papers()
-                self.paper_model.update_data(papers)
-                # 重新选中移动后的行
-                self.paper_table_view.selectRow(row - 1)
-                self.statusBar().showMessage(f"已上移", 2000)
-        
-        elif current_tab == 1:
-            indexes = self.patent_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row == 0:
-                return
-            
-            item_id = self.patent_model._data[row]['id']
-            if self.db.move_item_up('patents', item_id, self.patent_model._data):
-                patents = self.db.get_all_patents()
-                self.patent_model.update_data(patents)
-                self.patent_table_view.selectRow(row - 1)
-                self.statusBar().showMessage(f"已上移", 2000)
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        indexes = ctx.view.selectionModel().selectedRows()
+        if not indexes:
+            return
+        row = indexes[0].row()
+        if row == 0:
+            return  # 已经在最上面
         
-        elif current_tab == 2:
-            indexes = self.software_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row == 0:
-                return
-            
-            item_id = self.software_model._data[row]['id']
-            if self.db.move_item_up('softwares', item_id, self.software_model._data):
-                softwares = self.db.get_all_softwares()
-                self.software_model.update_data(softwares)
-                self.software_table_view.selectRow(row - 1)
-                self.statusBar().showMessage(f"已上移", 2000)
+        item_id = ctx.model._data[row]['id']
+        if self.db.move_item_up(ctx.table, item_id, ctx.model._data):
+            # 原地交换两行，无需重新加载
+            ctx.model.move_row(row, row - 1)
+            # 重新选中移动后的行
+            ctx.view.selectRow(row - 1)
+            self.statusBar().showMessage(f"已上移", 2000)
     
     def _move_item_down(self):
         """Ctrl+Down: 将选中项下移"""
         if not self.db:
             return
         
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            indexes = self.paper_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row >= len(self.paper_model._data) - 1:
-                return  # 已经在最下面
-            
-            item_id = self.paper_model._data[row]['id']
-            if self.db.move_item_down('papers', item_id, self.paper_model._data):
-                papers = self.db.get_all_papers()
-                self.paper_model.update_data(papers)
-                self.paper_table_view.selectRow(row + 1)
-                self.statusBar().showMessage(f"已下移", 2000)
-        
-        elif current_tab == 1:
-            indexes = self.patent_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row >= len(self.patent_model._data) - 1:
-                return
-            
-            item_id = self.patent_model._data[row]['id']
-            if self.db.move_item_down('patents', item_id, self.patent_model._data):
-                patents = self.db.get_all_patents()
-                self.patent_model.update_data(patents)
-                self.patent_table_view.selectRow(row + 1)
-                self.statusBar().showMessage(f"已下移", 2000)
-        
-        elif current_tab == 2:
-            indexes = self.software_table_view.selectionModel().selectedRows()
-            if not indexes:
-                return
-            row = indexes[0].row()
-            if row >= len(self.software_model._data) - 1:
-                return
-            
-            item_id = self.software_model._data[row]['id']
-            if self.db.move_item_down('softwares', item_id, self.software_model._data):
-                softwares = self.db.get_all_softwares()
-                self.software_model.update_data(softwares)
-                self.software_table_view.selectRow(row + 1)
-                self.statusBar().showMessage(f"已下移", 2000)
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        indexes = ctx.view.selectionModel().selectedRows()
+        if not indexes:
+            return
+        row = indexes[0].row()
+        if row >= len(ctx.model._data) - 1:
+            return  # 已经在最下面
+        
+        item_id = ctx.model._data[row]['id']
+        if self.db.move_item_down(ctx.table, item_id, ctx.model._data):
+            ctx.model.move_row(row, row + 1)
+            ctx.view.selectRow(row + 1)
+            self.statusBar().showMessage(f"已下移", 2000)
+    
+    def _selected_abs_path(self):
+        """获取当前标签页首个选中项的文件绝对路径（文件存在时）"""
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        indexes = ctx.view.selectionModel().selectedRows()
+        if not indexes:
+            return None
+        item = ctx.get_item(indexes[0].row())
+        if not item or not item.get('file_path'):
+            return None
+        abs_path = self._get_abs_path(item['file_path'])
+        if abs_path and os.path.exists(abs_path):
+            return abs_path
+        return None
     
     def _open_selected_file(self):
         """Enter: 打开选中文件"""
-        current_tab = self.tab_widget.currentIndex()
-        if current_tab == 0:
-            indexes = self.paper_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                paper = self.paper_model.get_paper_at(row)
-                if paper:
-                    file_path = paper.get('file_path', '')
-                    if file_path:
-                        abs_path = self._get_abs_path(file_path)
-                        if abs_path and os.path.exists(abs_path):
-                            os.startfile(abs_path)
-        elif current_tab == 1:
-            indexes = self.patent_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                patent = self.patent_model.get_patent_at(row)
-                if patent:
-                    file_path = patent.get('file_path', '')
-                    if file_path:
-                        abs_path = self._get_abs_path(file_path)
-                        if abs_path and os.path.exists(abs_path):
-                            os.startfile(abs_path)
-        elif current_tab == 2:
-            indexes = self.software_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                software = self.software_model.get_software_at(row)
-                if software:
-                    file_path = software.get('file_path', '')
-                    if file_path:
-                        abs_path = self._get_abs_path(file_path)
-                        if abs_path and os.path.exists(abs_path):
-                            os.startfile(abs_path)
+        abs_path = self._selected_abs_path()
+        if abs_path and not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+            QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
     
     def _open_selected_folder(self):
         """Ctrl+E: 打开选中文件所在文件夹"""
-        current_tab = self.tab_widget.currentIndex()
-        rel_path = None
-        
-        if current_tab == 0:
-            indexes = self.paper_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                rel_path = self.paper_model._data[row].get('rel_path', '')
-        elif current_tab == 1:
-            indexes = self.patent_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                rel_path = self.patent_model._data[row].get('pdf_path', '')
-        elif current_tab == 2:
-            indexes = self.software_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                rel_path = self.software_model._data[row].get('pdf_path', '')
-        
-        if rel_path:
-            abs_path = self._get_abs_path(rel_path)
-            if abs_path and os.path.exists(abs_path):
-                folder = os.path.dirname(abs_path)
-                os.startfile(folder)
+        abs_path = self._selected_abs_path()
+        if abs_path:
+            folder = os.path.dirname(abs_path)
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(folder)):
+                QMessageBox.warning(self, "错误", f"无法打开文件夹: {folder}")
     
     def _copy_selected_citation(self):
         """Ctrl+C: 复制选中项的引用"""
-        current_tab = self.tab_widget.currentIndex()
-        if current_tab == 0:
-            indexes = self.paper_table_view.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                data = self.paper_model._data[row]
-                from core.export import format_gbt7714
-                citation = format_gbt7714(data)
-                QApplication.clipboard().setText(citation)
-                self.statusBar().showMessage("已复制引用到剪贴板")
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        indexes = ctx.view.selectionModel().selectedRows()
+        if not indexes:
+            return
+        item = ctx.get_item(indexes[0].row())
+        if item:
+            QApplication.clipboard().setText(ctx.format_citation(item))
+            self.statusBar().showMessage("已复制引用到剪贴板")
     
     def _update_scan_button_state(self):
         has_db = self.db is not None
@@ -1198,11 +1539,21 @@ class MainWindow(QMainWindow):
         
         # 应用年份筛选
         papers = self._apply_year_filter(papers)
-        self.paper_model.update_data(papers)
+        self.paper_model.apply(papers)
         
         self._refresh_tag_filter()
         self._update_year_filter()
     
+    def _on_paper_data_changed(self, paper):
+        """详情面板保存后：无筛选时只更新该论文所在行，否则整体刷新"""
+        row = self.paper_model.row_for_id(paper.get('id'))
+        if (row is None or self.tag_filter.currentText() not in ("", "全部标签")
+                or self.year_filter.currentText() not in ("", "全部年份")):
+            self.refresh_table()
+            return
+        self.paper_model.update_row(row, paper)
+        self._update_year_filter()
+    
     def refresh_patents(self):
         if self.db:
             current_tag = self.tag_filter.currentText()
@@ -1213,7 +1564,7 @@ class MainWindow(QMainWindow):
             
             # 应用年份筛选
             patents = self._apply_year_filter(patents, year_field='grant_date')
-            self.patent_model.update_data(patents)
+            self.patent_model.apply(patents)
     
     def refresh_softwares(self):
         if self.db:
@@ -1225,7 +1576,7 @@ class MainWindow(QMainWindow):
             
             # 应用年份筛选
             softwares = self._apply_year_filter(softwares, year_field='development_date')
-            self.software_model.update_data(softwares)
+            self.software_model.apply(softwares)
     
     def _on_tab_changed(self, index):
         self.stacked_detail.setCurrentIndex(index)
@@ -1241,12 +1592,7 @@ class MainWindow(QMainWindow):
         # 刷新年份筛选
         self._update_year_filter()
         
-        if index == 0:
-            self.refresh_table()
-        elif index == 1:
-            self.refresh_patents()
-        elif index == 2:
-            self.refresh_softwares()
+        self._tabs[index].refresh()
     
     def _on_paper_current_changed(self, current, previous):
         if current.isValid():
@@ -1288,10 +1634,8 @@ class MainWindow(QMainWindow):
             if file_path:
                 abs_path = self._get_abs_path(file_path)
                 if abs_path and os.path.exists(abs_path):
-                    try:
-                        os.startfile(abs_path)
-                    except Exception as e:
-                        QMessageBox.warning(self, "错误", f"无法打开文件: {e}")
+                    if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                        QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
     
     def _on_software_double_click(self, index):
         row = index.row()
@@ -1301,32 +1645,25 @@ class MainWindow(QMainWindow):
             if file_path:
                 abs_path = self._get_abs_path(file_path)
                 if abs_path and os.path.exists(abs_path):
-                    try:
-                        os.startfile(abs_path)
-                    except Exception as e:
-                        QMessageBox.warning(self, "错误", f"无法打开文件: {e}")
+                    if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                        QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
     
     def _refresh_tag_filter(self):
         """刷新标签筛选下拉框（根据当前标签页）"""
+        tag_names = ()
+        if self.db:
+            tags = self._tabs[self.tab_widget.currentIndex()].get_tags()
+            tag_names = tuple(tag['name'] for tag in tags)
+        
+        # 标签列表未变化时无需重建下拉框
+        if tag_names == self._tag_filter_names:
+            return
+        self._tag_filter_names = tag_names
+        
         current_text = self.tag_filter.currentText()
         self.tag_filter.blockSignals(True)
         self.tag_filter.clear()
-        self.tag_filter.addItem("全部标签")
-        
-        if self.db:
-            current_tab = self.tab_widget.currentIndex()
-            if current_tab == 0:
-                # 论文标签
-                tags = self.db.get_all_tags()
-            elif current_tab == 1:
-                # 专利标签
-                tags = self.db.get_all_patent_tags()
-            else:
-                # 软著标签
-                tags = self.db.get_all_software_tags()
-            
-            for tag in tags:
-                self.tag_filter.addItem(tag['name'])
+        self.tag_filter.addItems(["全部标签", *tag_names])
         
         # 恢复之前选中的标签（如果存在）
         index = self.tag_filter.findText(current_text)
@@ -1342,40 +1679,15 @@ class MainWindow(QMainWindow):
         if not self.db:
             return
         
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            # 论文
-            if tag_name == "全部标签" or not tag_name:
-                papers = self.db.get_all_papers()
-            else:
-                papers = self.db.get_papers_by_tag_name(tag_name)
-            # 应用年份筛选
-            papers = self._apply_year_filter(papers)
-            self.paper_model.update_data(papers)
-            self.statusBar().showMessage(f"筛选: {tag_name} ({len(papers)} 篇)")
-        
-        elif current_tab == 1:
-            # 专利
-            if tag_name == "全部标签" or not tag_name:
-                patents = self.db.get_all_patents()
-            else:
-                patents = self.db.get_patents_by_tag_name(tag_name)
-            # 应用年份筛选
-            patents = self._apply_year_filter(patents, year_field='grant_date')
-            self.patent_model.update_data(patents)
-            self.statusBar().showMessage(f"筛选: {tag_name} ({len(patents)} 项)")
-        
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        if tag_name == "全部标签" or not tag_name:
+            items = ctx.get_all()
         else:
-            # 软著
-            if tag_name == "全部标签" or not tag_name:
-                softwares = self.db.get_all_softwares()
-            else:
-                softwares = self.db.get_softwares_by_tag_name(tag_name)
-            # 应用年份筛选
-            softwares = self._apply_year_filter(softwares, year_field='development_date')
-            self.software_model.update_data(softwares)
-            self.statusBar().showMessage(f"筛选: {tag_name} ({len(softwares)} 个)")
+            items = ctx.get_by_tag_name(tag_name)
+        # 应用年份筛选
+        items = self._apply_year_filter(items, year_field=ctx.year_field)
+        ctx.model.apply(items)
+        self.statusBar().showMessage(f"筛选: {tag_name} ({len(items)} {ctx.unit})")
     
     def _on_year_filter(self, year_text):
         """按年份筛选"""
@@ -1403,8 +1715,7 @@ class MainWindow(QMainWindow):
                             filtered.append(item)
                     elif isinstance(item_year, str):
                         # 从日期字符串中提取年份
-                        import re
-                        year_match = re.search(r'(\d{4})', str(item_year))
+                        year_match = _YEAR_RE.search(item_year)
                         if year_match and int(year_match.group(1)) == filter_year:
                             filtered.append(item)
             return filtered
@@ -1416,36 +1727,15 @@ class MainWindow(QMainWindow):
         if not self.db:
             return
         
-        current_tab = self.tab_widget.currentIndex()
+        # 论文取年份字段，专利/软著从授权日期、开发完成日期中提取年份
+        ctx = self._tabs[self.tab_widget.currentIndex()]
         years = set()
-        
-        if current_tab == 0:
-            # 论文年份
-            papers = self.db.get_all_papers()
-            for p in papers:
-                year = p.get('year')
-                if year:
-                    years.add(int(year))
-        elif current_tab == 1:
-            # 专利年份（从授权日期提取）
-            patents = self.db.get_all_patents()
-            import re
-            for p in patents:
-                date = p.get('grant_date', '')
-                if date:
-                    match = re.search(r'(\d{4})', str(date))
-                    if match:
-                        years.add(int(match.group(1)))
-        else:
-            # 软著年份（从开发完成日期提取）
-            softwares = self.db.get_all_softwares()
-            import re
-            for s in softwares:
-                date = s.get('development_date', '')
-                if date:
-                    match = re.search(r'(\d{4})', str(date))
-                    if match:
-                        years.add(int(match.group(1)))
+        for item in ctx.get_all():
+            value = item.get(ctx.year_field)
+            if value:
+                match = _YEAR_RE.search(str(value))
+                if match:
+                    years.add(int(match.group(1)))
         
         # 更新下拉列表
         self.year_filter.blockSignals(True)
@@ -1471,14 +1761,31 @@ class MainWindow(QMainWindow):
         if not directory:
             return
         
+        self._run_scan(directory, "扫描中...")
+    
+    def _scan_running(self):
+        """扫描进行中时提示用户，避免重复启动或在扫描中删除数据库"""
+        if self.scan_thread and self.scan_thread.isRunning():
+            QMessageBox.information(self, "提示", "正在扫描，请等待当前扫描完成")
+            return True
+        return False
+    
+    def _run_scan(self, directory, message):
+        if self._scan_running():
+            return
+        
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.statusBar().showMessage("扫描中...")
+        self.statusBar().showMessage(message)
+        self.btn_scan.setEnabled(False)
+        self.refresh_db_action.setEnabled(False)
+        self.rebuild_db_action.setEnabled(False)
         
         self.scan_thread = ScanThread(self.db, directory)
-        self.scan_thread.progress.connect(self.progress_bar.setValue)
-        self.scan_thread.status.connect(self.statusBar().showMessage)
-        self.scan_thread.finished.connect(self._on_scan_finished)
+        # 显式使用队列连接，确保槽函数始终在界面线程执行
+        self.scan_thread.progress.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.scan_thread.status.connect(self.statusBar().showMessage, Qt.QueuedConnection)
+        self.scan_thread.finished.connect(self._on_scan_finished, Qt.QueuedConnection)
         self.scan_thread.start()
     
     def _refresh_database(self):
@@ -1490,21 +1797,15 @@ class MainWindow(QMainWindow):
         
         directory = self.root_dir
         print(f"[DEBUG] _refresh_database: starting scan on {directory}")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.statusBar().showMessage("刷新中...")
-        
-        self.scan_thread = ScanThread(self.db, directory)
-        self.scan_thread.progress.connect(self.progress_bar.setValue)
-        self.scan_thread.status.connect(self.statusBar().showMessage)
-        self.scan_thread.finished.connect(self._on_scan_finished)
-        self.scan_thread.start()
+        self._run_scan(directory, "刷新中...")
     
     def _rebuild_database(self):
         """重建数据库：删除现有数据库并重新扫描"""
         if not self.db or not self.root_dir:
             QMessageBox.warning(self, "警告", "请先打开数据库")
             return
+        if self._scan_running():
+            return
         
         reply = QMessageBox.question(
             self,
@@ -1523,13 +1824,14 @@ class MainWindow(QMainWindow):
             original_db_path = self.db.db_path
             root_dir = self.root_dir
             
+            self._stop_paper_metadata_threads()
             self.db = None
             
+            from db.database import Database, remove_database_files
             if os.path.exists(original_db_path):
-                os.remove(original_db_path)
+                remove_database_files(original_db_path)
                 logger.info(f"Removed old database: {original_db_path}")
             
-            from db.database import Database
             self.db = Database(original_db_path)
             self.db_path = original_db_path
             
@@ -1551,13 +1853,21 @@ class MainWindow(QMainWindow):
     
     def _on_scan_finished(self, updated):
         self.progress_bar.setVisible(False)
-        self.refresh_table()
-        self.refresh_patents()
-        self.refresh_softwares()
+        self._update_scan_button_state()
+        self.refresh_db_action.setEnabled(True)
+        self.rebuild_db_action.setEnabled(True)
+        counts = Counter(u.get('type') for u in updated)
+        paper_count = counts['paper']
+        patent_count = counts['patent']
+        software_count = counts['software']
+        # 只刷新本次扫描有新增的标签页；无新增时全部刷新（如新建数据库后首次扫描）
+        if paper_count or not updated:
+            self.refresh_table()
+        if patent_count or not updated:
+            self.refresh_patents()
+        if software_count or not updated:
+            self.refresh_softwares()
         if updated:
-            paper_count = sum(1 for u in updated if u.get('type') == 'paper')
-            patent_count = sum(1 for u in updated if u.get('type') == 'patent')
-            software_count = sum(1 for u in updated if u.get('type') == 'software')
             msg = f"扫描完成，新增/更新: {paper_count} 篇文献, {patent_count} 项专利, {software_count} 项软著"
             QMessageBox.information(self, "完成", msg)
         else:
@@ -1567,72 +1877,45 @@ class MainWindow(QMainWindow):
         if not self.db or not self.db_path:
             QMessageBox.warning(self, "警告", "没有打开的数据库")
             return
+        if self._backup_thread and self._backup_thread.isRunning():
+            QMessageBox.information(self, "提示", "正在备份或恢复数据库，请稍候")
+            return
         
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_name = f"literature_backup_{timestamp}.sql"
+        default_name = f"literature_backup_{timestamp}.db"
         
-        path, _ = QFileDialog.getSaveFileName(
-            self, "备份数据库", default_name, "SQL Files (*.sql)"
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "备份数据库", default_name, "SQLite 数据库 (*.db);;SQL Files (*.sql)"
         )
         if not path:
             return
         
-        try:
-            self.statusBar().showMessage("正在备份数据库...")
-            QApplication.processEvents()
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write("-- 数据库备份\n")
-                f.write(f"-- 备份时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("-- =====================\n\n")
-                
-                for table in ['papers', 'pdf_files', 'paper_files', 'patents', 'softwares', 'tags', 'paper_tags']:
-                    cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
-                    table_sql = cursor.fetchone()
-                    if table_sql:
-                        f.write(f"-- 表: {table}\n")
-                        f.write(table_sql[0] + ';\n\n')
-                
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-                tables = [row[0] for row in cursor.fetchall()]
-                
-                for table in tables:
-                    cursor.execute(f"SELECT * FROM {table}")
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    
-                    if rows:
-                        f.write(f"-- 数据: {table}\n")
-                        for row in rows:
-                            values = []
-                            for val in row:
-                                if val is None:
-                                    values.append('NULL')
-                                elif isinstance(val, (int, float)):
-                                    values.append(str(val))
-                                elif isinstance(val, bytes):
-                                    values.append(repr(val))
-                                else:
-                                    values.append("'" + str(val).replace("'", "''") + "'")
-                            f.write(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(values)});\n")
-                        f.write('\n')
-                
-                conn.close()
-            
-            self.statusBar().showMessage(f"备份完成: {path}")
-            QMessageBox.information(self, "完成", f"数据库已备份到:\n{path}")
-            
-        except Exception as e:
+        self.statusBar().showMessage("正在备份数据库...")
+        sql_format = path.lower().endswith('.sql') or selected_filter.startswith('SQL')
+        self._backup_thread = BackupThread(self.db, path, sql_format=sql_format)
+        self._backup_thread.finished.connect(self._on_backup_finished)
+        self._backup_thread.progress.connect(self.progress_bar.setValue)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self._backup_thread.start()
+    
+    def _on_backup_finished(self, ok, result):
+        self.progress_bar.setVisible(False)
+        if ok:
+            self.statusBar().showMessage(f"备份完成: {result}")
+            QMessageBox.information(self, "完成", f"数据库已备份到:\n{result}")
+        else:
             self.statusBar().showMessage("备份失败")
-            QMessageBox.critical(self, "错误", f"备份失败:\n{e}")
+            QMessageBox.critical(self, "错误", f"备份失败:\n{result}")
     
     def _restore_database(self):
+        if self._backup_thread and self._backup_thread.isRunning():
+            QMessageBox.information(self, "提示", "正在备份或恢复数据库，请稍候")
+            return
+        
         path, _ = QFileDialog.getOpenFileName(
-            self, "恢复数据库", "", "SQL Files (*.sql)"
+            self, "恢复数据库", "", "数据库备份 (*.db *.sql);;SQLite 数据库 (*.db);;SQL Files (*.sql)"
         )
         if not path:
             return
@@ -1645,38 +1928,27 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.No:
             return
         
-        try:
-            self.statusBar().showMessage("正在恢复数据库...")
-            QApplication.processEvents()
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                sql_content = f.read()
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall() if not row[0].startswith('sqlite_')]
-            
-            for table in tables:
-                cursor.execute(f"DROP TABLE IF EXISTS {table}")
-            
-            conn.commit()
-            
-            cursor.executescript(sql_content)
-            conn.commit()
-            conn.close()
-            
-            self.refresh_table()
-            self.refresh_patents()
-            self.refresh_softwares()
-            
-            self.statusBar().showMessage("恢复完成")
-            QMessageBox.information(self, "完成", "数据库已恢复")
-            
-        except Exception as e:
+        self.statusBar().showMessage("正在恢复数据库...")
+        self._backup_thread = BackupThread(self.db, path, restore=True)
+        self._backup_thread.finished.connect(self._on_restore_finished)
+        self._backup_thread.progress.connect(self.progress_bar.setValue)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self._backup_thread.start()
+    
+    def _on_restore_finished(self, ok, result):
+        self.progress_bar.setVisible(False)
+        if not ok:
             self.statusBar().showMessage("恢复失败")
-            QMessageBox.critical(self, "错误", f"恢复失败:\n{e}")
+            QMessageBox.critical(self, "错误", f"恢复失败:\n{result}")
+            return
+        
+        self.refresh_table()
+        self.refresh_patents()
+        self.refresh_softwares()
+        
+        self.statusBar().showMessage("恢复完成")
+        QMessageBox.information(self, "完成", "数据库已恢复")
     
     def _open_database_folder(self):
         """打开数据库所在文件夹"""
@@ -1686,60 +1958,29 @@ class MainWindow(QMainWindow):
         
         db_path = self.db.db_path
         if db_path:
-            folder = os.path.dirname(os.path.abspath(db_path))
-            if os.path.exists(folder):
-                os.startfile(folder)
-            else:
-                QMessageBox.warning(self, "警告", f"文件夹不存在: {folder}")
-        else:
-            QMessageBox.warning(self, "警告", "无法获取数据库路径")
-    
-    @Slot()
-    def _on_search(self, text):
-        """搜索（根据当前标签页）"""
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            # 论文搜索
-            if not text:
-                self.refresh_table()
-                return
-            papers = self.db.get_all_papers()
-            text_lower = text.lower()
-            filtered = [p for p in papers if any(
-                text_lower in (str(p.get(f, '')) or '').lower() 
-                for f in ['title', 'authors', 'doi', 'venue']
-            )]
-            self.paper_model.update_data(filtered)
-            self.statusBar().showMessage(f"搜索结果: {len(filtered)} 篇")
-        
-        elif current_tab == 1:
-            # 专利搜索
-            if not text:
-                self.refresh_patents()
-                return
-            patents = self.db.get_all_patents()
-            text_lower = text.lower()
-            filtered = [p for p in patents if any(
-                text_lower in (str(p.get(f, '')) or '').lower() 
-                for f in ['title', 'patent_number', 'inventors', 'patentee', 'grant_number']
-            )]
-            self.patent_model.update_data(filtered)
-            self.statusBar().showMessage(f"搜索结果: {len(filtered)} 项")
-        
+            folder = os.path.dirname(os.path.abspath(db_path))
+            if not os.path.exists(folder):
+                QMessageBox.warning(self, "警告", f"文件夹不存在: {folder}")
+            elif not QDesktopServices.openUrl(QUrl.fromLocalFile(folder)):
+                QMessageBox.warning(self, "错误", f"无法打开文件夹: {folder}")
         else:
-            # 软著搜索
-            if not text:
-                self.refresh_softwares()
-                return
-            softwares = self.db.get_all_softwares()
-            text_lower = text.lower()
-            filtered = [s for s in softwares if any(
-                text_lower in (str(s.get(f, '')) or '').lower() 
-                for f in ['software_name', 'title', 'registration_number', 'copyright_holder']
-            )]
-            self.software_model.update_data(filtered)
-            self.statusBar().showMessage(f"搜索结果: {len(filtered)} 个")
+            QMessageBox.warning(self, "警告", "无法获取数据库路径")
+    
+    @Slot()
+    def _on_search(self, text):
+        """搜索框内容变化：重新开始计时，停止输入后再搜索"""
+        self._search_timer.start()
+    
+    def _do_search(self):
+        """搜索（根据当前标签页）"""
+        text = self.search_edit.text()
+        ctx = self._tabs[self.tab_widget.currentIndex()]
+        if not text:
+            ctx.refresh()
+            return
+        filtered = ctx.search(text)
+        ctx.model.apply(filtered)
+        self.statusBar().showMessage(f"搜索结果: {len(filtered)} {ctx.unit}")
     
     def _on_row_click(self, index):
         row = index.row()
@@ -1755,10 +1996,8 @@ class MainWindow(QMainWindow):
             if file_path:
                 abs_path = self._get_abs_path(file_path)
                 if abs_path and os.path.exists(abs_path):
-                    try:
-                        os.startfile(abs_path)
-                    except Exception as e:
-                        QMessageBox.warning(self, "错误", f"无法打开文件: {e}")
+                    if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                        QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
                 else:
                     QMessageBox.warning(self, "错误", f"文件不存在: {abs_path}")
     
@@ -1837,7 +2076,8 @@ class MainWindow(QMainWindow):
                 return
             elif reply == QMessageBox.Retry:
                 try:
-                    os.remove(db_path)
+                    from db.database import remove_database_files
+                    remove_database_files(db_path)
                 except Exception as e:
                     QMessageBox.critical(self, "错误", f"无法删除现有数据库:\n{e}")
                     return
@@ -1877,6 +2117,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.No:
             return
         
+        self._stop_paper_metadata_threads()
         self.db = None
         self.db_path = None
         self.root_dir = None
@@ -1948,13 +2189,12 @@ class MainWindow(QMainWindow):
                 return
             
             try:
-                for idx in selected:
-                    row = idx.row()
-                    paper = self.paper_model.get_paper_at(row)
-                    if paper and paper.get('id'):
-                        self.db.delete_paper(paper['id'])
+                rows = [idx.row() for idx in selected]
+                papers = self.paper_model.get_selected_papers(rows)
+                self.db.delete_papers([paper['id'] for paper in papers if paper.get('id')])
                 
-                self.refresh_table()
+                self.paper_model.remove_rows(rows)
+                self._update_year_filter()
                 self.detail_panel.load_paper(None)
                 self.statusBar().showMessage(f"已删除 {count} 篇文献")
                 
@@ -1980,13 +2220,12 @@ class MainWindow(QMainWindow):
                 return
             
             try:
-                for idx in selected:
-                    row = idx.row()
-                    patent = self.patent_model.get_patent_at(row)
-                    if patent and patent.get('id'):
-                        self.db.delete_patent(patent['id'])
+                rows = [idx.row() for idx in selected]
+                patents = self.patent_model.get_selected_patents(rows)
+                self.db.delete_patents([patent['id'] for patent in patents if patent.get('id')])
                 
-                self.refresh_patents()
+                self.patent_model.remove_rows(rows)
+                self._update_year_filter()
                 self.patent_detail_panel.load_patent(None)
                 self.statusBar().showMessage(f"已删除 {count} 项专利")
                 
@@ -2012,13 +2251,12 @@ class MainWindow(QMainWindow):
                 return
             
             try:
-                for idx in selected:
-                    row = idx.row()
-                    software = self.software_model.get_software_at(row)
-                    if software and software.get('id'):
-                        self.db.delete_software(software['id'])
+                rows = [idx.row() for idx in selected]
+                softwares = self.software_model.get_selected_softwares(rows)
+                self.db.delete_softwares([software['id'] for software in softwares if software.get('id')])
                 
-                self.refresh_softwares()
+                self.software_model.remove_rows(rows)
+                self._update_year_filter()
                 self.software_detail_panel.load_software(None)
                 self.statusBar().showMessage(f"已删除 {count} 项软著")
                 
@@ -2183,18 +2421,10 @@ class MainWindow(QMainWindow):
         self._write_settings(settings)
     
     def _read_settings(self):
-        config_path = 'preferences.json'
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
+        return _load_preferences() or {}
     
     def _write_settings(self, settings):
-        with open('preferences.json', 'w', encoding='utf-8') as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        _save_preferences(settings)
     
     def _load_theme_setting(self):
         settings = self._read_settings()
@@ -2222,34 +2452,34 @@ class MainWindow(QMainWindow):
         menu = QMenu(self)
         
         open_action = QAction("打开文件", self)
-        open_action.triggered.connect(lambda: self._context_open_file(table_view, model, item_type))
+        open_action.triggered.connect(partial(self._context_open_file, table_view, model, item_type))
         menu.addAction(open_action)
         
         open_folder_action = QAction("打开所在文件夹", self)
-        open_folder_action.triggered.connect(lambda: self._context_open_folder(table_view, model, item_type))
+        open_folder_action.triggered.connect(partial(self._context_open_folder, table_view, model, item_type))
         menu.addAction(open_folder_action)
         
         menu.addSeparator()
         
         copy_title_action = QAction("复制标题", self)
-        copy_title_action.triggered.connect(lambda: self._context_copy_title(table_view, model, item_type))
+        copy_title_action.triggered.connect(partial(self._context_copy_title, table_view, model, item_type))
         menu.addAction(copy_title_action)
         
         if item_type == 'paper':
             copy_cite_action = QAction("复制引用 (GB/T 7714)", self)
-            copy_cite_action.triggered.connect(lambda: self._context_copy_citation(table_view, model))
+            copy_cite_action.triggered.connect(partial(self._context_copy_citation, table_view, model))
             menu.addAction(copy_cite_action)
             
             menu.addSeparator()
             
             # 绑定PDF文件
             bind_pdf_action = QAction("绑定PDF文件...", self)
-            bind_pdf_action.triggered.connect(lambda: self._context_bind_pdf(table_view, model))
+            bind_pdf_action.triggered.connect(partial(self._context_bind_pdf, table_view, model))
             menu.addAction(bind_pdf_action)
             
             # 重命名PDF文件
             rename_pdf_action = QAction("重命名PDF文件...", self)
-            rename_pdf_action.triggered.connect(lambda: self._context_rename_pdf(table_view, model))
+            rename_pdf_action.triggered.connect(partial(self._context_rename_pdf, table_view, model))
             menu.addAction(rename_pdf_action)
             
             menu.addSeparator()
@@ -2257,11 +2487,11 @@ class MainWindow(QMainWindow):
             tags_menu = menu.addMenu("标签")
             
             add_tag_action = QAction("添加标签...", self)
-            add_tag_action.triggered.connect(lambda: self._context_add_tag(table_view, model))
+            add_tag_action.triggered.connect(partial(self._context_add_tag, table_view, model))
             tags_menu.addAction(add_tag_action)
             
             manage_tags_action = QAction("管理标签...", self)
-            manage_tags_action.triggered.connect(lambda: self._context_manage_tags(table_view, model))
+            manage_tags_action.triggered.connect(partial(self._context_manage_tags, table_view, model))
             tags_menu.addAction(manage_tags_action)
             
             tags_menu.addSeparator()
@@ -2270,7 +2500,7 @@ class MainWindow(QMainWindow):
             if all_tags:
                 for tag in all_tags[:10]:
                     tag_action = QAction(f"  {tag['name']}", self)
-                    tag_action.triggered.connect(lambda checked, t=tag: self._context_quick_add_tag(table_view, model, t['id']))
+                    tag_action.triggered.connect(partial(self._context_quick_add_tag, table_view, model, tag['id']))
                     tags_menu.addAction(tag_action)
         
         menu.addSeparator()
@@ -2281,87 +2511,61 @@ class MainWindow(QMainWindow):
         
         menu.exec(table_view.viewport().mapToGlobal(pos))
     
-    def _context_open_file(self, table_view, model, item_type):
-        """右键菜单：打开文件"""
+    def _first_selected(self, table_view, model):
+        """右键菜单：返回第一条选中行的数据和行号，未选中时返回 (None, -1)"""
         indexes = table_view.selectionModel().selectedRows()
         if not indexes:
-            return
+            return None, -1
         row = indexes[0].row()
-        if item_type == 'paper':
-            data = model._data[row]
-            rel_path = data.get('rel_path', '')
-        elif item_type == 'patent':
-            data = model._data[row]
-            rel_path = data.get('pdf_path', '')
-        else:
-            data = model._data[row]
-            rel_path = data.get('pdf_path', '')
+        return model._data[row], row
+    
+    def _context_open_file(self, table_view, model, item_type):
+        """右键菜单：打开文件"""
+        data, _ = self._first_selected(table_view, model)
+        if data is None:
+            return
+        rel_path = data.get(_ITEM_FIELDS[item_type][0])
         
         if rel_path:
+            # 直接打开，文件不存在时 openUrl 返回 False，省去事先的存在性检查
             abs_path = self._get_abs_path(rel_path)
-            if abs_path and os.path.exists(abs_path):
-                os.startfile(abs_path)
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
     
     def _context_open_folder(self, table_view, model, item_type):
         """右键菜单：打开所在文件夹"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        data, _ = self._first_selected(table_view, model)
+        if data is None:
             return
-        row = indexes[0].row()
-        if item_type == 'paper':
-            data = model._data[row]
-            rel_path = data.get('rel_path', '')
-        elif item_type == 'patent':
-            data = model._data[row]
-            rel_path = data.get('pdf_path', '')
-        else:
-            data = model._data[row]
-            rel_path = data.get('pdf_path', '')
+        rel_path = data.get(_ITEM_FIELDS[item_type][0])
         
         if rel_path:
-            abs_path = self._get_abs_path(rel_path)
-            if abs_path and os.path.exists(abs_path):
-                folder = os.path.dirname(abs_path)
-                os.startfile(folder)
+            folder = os.path.dirname(self._get_abs_path(rel_path))
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(folder)):
+                QMessageBox.warning(self, "错误", f"无法打开文件夹: {folder}")
     
     def _context_copy_title(self, table_view, model, item_type):
         """右键菜单：复制标题"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        data, _ = self._first_selected(table_view, model)
+        if data is None:
             return
-        row = indexes[0].row()
-        data = model._data[row]
-        
-        if item_type == 'paper':
-            title = data.get('title', '')
-        elif item_type == 'patent':
-            title = data.get('patent_name', '')
-        else:
-            title = data.get('software_name', '')
-        
+        title = data.get(_ITEM_FIELDS[item_type][1])
         if title:
             QApplication.clipboard().setText(title)
     
     def _context_copy_citation(self, table_view, model):
         """右键菜单：复制GB/T 7714引用"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        data, _ = self._first_selected(table_view, model)
+        if data is None:
             return
-        row = indexes[0].row()
-        data = model._data[row]
         
-        from core.export import format_gbt7714
-        citation = format_gbt7714(data)
-        QApplication.clipboard().setText(citation)
+        QApplication.clipboard().setText(_format_citation('paper', data))
     
     def _context_bind_pdf(self, table_view, model):
         """右键菜单：绑定PDF文件到论文"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        paper, row = self._first_selected(table_view, model)
+        if paper is None:
             return
-        
-        row = indexes[0].row()
-        paper = model._data[row]
         paper_id = paper.get('id')
         
         if not paper_id:
@@ -2388,16 +2592,24 @@ class MainWindow(QMainWindow):
         if not pdf_path:
             return
         
+        # 先确定相对路径：不在数据库所在磁盘时直接提示，不再读取文件
         try:
-            import hashlib
-            
-            # 计算文件信息
-            with open(pdf_path, 'rb') as f:
-                sha256 = hashlib.sha256(f.read()).hexdigest()
+            rel_path = os.path.relpath(pdf_path, self.root_dir)
+        except ValueError:
+            QMessageBox.warning(self, "错误", f"PDF文件需与数据库位于同一磁盘:\n{pdf_path}")
+            return
+        filename = os.path.basename(pdf_path)
+        
+        try:
+            from core.scanner import hash_file
             
+            # 同一路径已登记且大小、修改时间未变时沿用已有哈希，否则分块计算
             stat = os.stat(pdf_path)
-            rel_path = os.path.relpath(pdf_path, self.root_dir)
-            filename = os.path.basename(pdf_path)
+            known = self.db.get_pdf_by_path(rel_path)
+            if known and known['size'] == stat.st_size and known['mtime'] == stat.st_mtime:
+                sha256 = known['sha256']
+            else:
+                sha256, stat = hash_file(pdf_path, stat)
             
             # 添加或更新PDF记录
             pdf_id = self.db.upsert_pdf_file(
@@ -2416,8 +2628,9 @@ class MainWindow(QMainWindow):
             # 关联论文和PDF
             self.db.link_paper_pdf(paper_id, pdf_id)
             
-            # 刷新表格
-            self.refresh_table()
+            # 只刷新该行
+            model.update_row(row, {'file_path': rel_path, 'file_name': filename,
+                                   'parse_status': 'success', 'sha256': sha256})
             
             self.statusBar().showMessage(f"已绑定PDF: {filename}")
             QMessageBox.information(self, "成功", f"已将PDF文件绑定到论文:\n{paper.get('title', '')[:50]}...")
@@ -2428,13 +2641,10 @@ class MainWindow(QMainWindow):
     
     def _context_rename_pdf(self, table_view, model):
         """右键菜单：重命名PDF文件"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        paper, row = self._first_selected(table_view, model)
+        if paper is None:
             return
         
-        row = indexes[0].row()
-        paper = model._data[row]
-        
         # 获取当前PDF路径
         rel_path = paper.get('file_path') or paper.get('rel_path')
         if not rel_path:
@@ -2462,7 +2672,7 @@ class MainWindow(QMainWindow):
         
         new_name = new_name.strip()
         # 清理非法字符
-        new_name = re.sub(r'[<>:"/\\|?*]', '_', new_name)
+        new_name = _ILLEGAL_FILENAME_RE.sub('_', new_name)
         new_filename = f"{new_name}{ext}"
         
         if new_filename == current_filename:
@@ -2485,8 +2695,8 @@ class MainWindow(QMainWindow):
             new_rel_path = os.path.relpath(new_abs_path, self.root_dir)
             self.db.update_pdf_path(rel_path, new_rel_path, new_filename)
             
-            # 刷新表格
-            self.refresh_table()
+            # 只刷新该行
+            model.update_row(row, {'file_path': new_rel_path, 'file_name': new_filename})
             
             self.statusBar().showMessage(f"已重命名: {new_filename}")
             
@@ -2503,34 +2713,36 @@ class MainWindow(QMainWindow):
         tag_name, ok = QInputDialog.getText(self, "添加标签", "输入标签名称:")
         if ok and tag_name.strip():
             tag_id = self.db.get_or_create_tag(tag_name.strip())
-            for idx in indexes:
-                row = idx.row()
-                paper_id = model._data[row].get('id')
-                if paper_id:
-                    self.db.add_tag_to_paper(paper_id, tag_id)
+            papers = model.get_selected_papers([idx.row() for idx in indexes])
+            self.db.add_tag_to_papers([paper['id'] for paper in papers if paper.get('id')], tag_id)
             self.statusBar().showMessage(f"已添加标签: {tag_name}")
     
     def _context_manage_tags(self, table_view, model):
         """右键菜单：管理标签"""
-        indexes = table_view.selectionModel().selectedRows()
-        if not indexes:
+        paper, _ = self._first_selected(table_view, model)
+        if paper is None:
             return
-        row = indexes[0].row()
-        paper_id = model._data[row].get('id')
+        paper_id = paper.get('id')
         if paper_id:
             dialog = TagManagerDialog(self.db, paper_id, self)
             dialog.exec()
     
     def _context_quick_add_tag(self, table_view, model, tag_id):
         """右键菜单：快速添加标签"""
-        indexes = table_view.selectionModel().selectedRows()
-        for idx in indexes:
-            row = idx.row()
-            paper_id = model._data[row].get('id')
-            if paper_id:
-                self.db.add_tag_to_paper(paper_id, tag_id)
+        papers = model.get_selected_papers([idx.row() for idx in table_view.selectionModel().selectedRows()])
+        self.db.add_tag_to_papers([paper['id'] for paper in papers if paper.get('id')], tag_id)
         self.statusBar().showMessage("标签已添加")
     
+    def _paper_stats(self, name: str, compute: Callable) -> Any:
+        """取论文统计结果：论文模型未变化时直接复用上次的汇总，多个统计对话框共用"""
+        version = self.paper_model._version
+        key = (name, version)
+        if key not in self._stats_cache:
+            if any(v != version for _, v in self._stats_cache):
+                self._stats_cache.clear()
+            self._stats_cache[key] = compute(self.paper_model._data)
+        return self._stats_cache[key]
+    
     def _show_journal_impact_factors(self):
         dialog = JournalImpactDialog(self)
         dialog.exec()
@@ -2572,7 +2784,9 @@ class MainWindow(QMainWindow):
     
     def _build_fulltext_index(self):
         """建立全文索引"""
-        import fitz
+        if self._fulltext_thread and self._fulltext_thread.isRunning():
+            QMessageBox.information(self, "提示", "正在建立全文索引，请稍候")
+            return
         
         stats = self.db.get_fulltext_stats()
         unindexed = self.db.get_unindexed_pdfs()
@@ -2592,46 +2806,33 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         
-        progress = QProgressDialog("正在建立全文索引...", "取消", 0, len(unindexed), self)
+        jobs = []
+        for pdf in unindexed:
+            abs_path = self._get_abs_path(pdf['path'])
+            if abs_path and os.path.exists(abs_path):
+                jobs.append((pdf['id'], abs_path, pdf['filename'] or pdf['path']))
+        
+        progress = QProgressDialog("正在建立全文索引...", "取消", 0, len(jobs), self)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
         
-        indexed = 0
-        failed = 0
-        
-        for i, pdf in enumerate(unindexed):
-            if progress.wasCanceled():
-                break
-            
-            progress.setValue(i)
-            progress.setLabelText(f"正在索引: {pdf['filename'] or pdf['path']}")
-            QApplication.processEvents()
-            
-            try:
-                abs_path = self._get_abs_path(pdf['path'])
-                if abs_path and os.path.exists(abs_path):
-                    doc = fitz.open(abs_path)
-                    text_parts = []
-                    for page in doc:
-                        text_parts.append(page.get_text())
-                    doc.close()
-                    
-                    content = '\n'.join(text_parts)
-                    if content.strip():
-                        self.db.save_fulltext(pdf['id'], content)
-                        indexed += 1
-            except Exception as e:
-                failed += 1
-                logger.error(f"索引失败 {pdf['path']}: {e}")
-        
-        progress.setValue(len(unindexed))
-        
+        self._fulltext_thread = FulltextIndexThread(self.db, jobs)
+        self._fulltext_thread.progress.connect(
+            lambda done, name: (progress.setValue(done), progress.setLabelText(f"已索引: {name}")),
+            Qt.QueuedConnection)
+        self._fulltext_thread.finished.connect(
+            lambda indexed, failed: self._on_fulltext_index_finished(progress, indexed, failed),
+            Qt.QueuedConnection)
+        progress.canceled.connect(self._fulltext_thread.requestInterruption)
+        self._fulltext_thread.start()
+    
+    def _on_fulltext_index_finished(self, progress, indexed, failed):
+        progress.close()
         QMessageBox.information(
             self, "索引完成",
             f"成功索引: {indexed} 个文件\n"
             f"失败: {failed} 个文件"
         )
-        dialog.exec()
 
 
 class PreferencesDialog(QDialog):
@@ -2724,6 +2925,8 @@ class PreferencesDialog(QDialog):
         self.exclude_list.setMaximumHeight(60)
         self.exclude_list.setSelectionMode(QListWidget.SingleSelection)
         exclude_layout.addWidget(self.exclude_list)
+        # 与列表内容同步的集合，用于查重
+        self._exclude_set = set()
         
         exclude_btn_layout = QHBoxLayout()
         self.add_exclude_btn = QPushButton("添加")
@@ -2769,22 +2972,22 @@ class PreferencesDialog(QDialog):
         if ok and folder.strip():
             folder = folder.strip().replace('\\', '/')
             # 检查是否已存在
-            for i in range(self.exclude_list.count()):
-                if self.exclude_list.item(i).text() == folder:
-                    QMessageBox.warning(self, "警告", f"文件夹 '{folder}' 已在排除列表中")
-                    return
+            if folder in self._exclude_set:
+                QMessageBox.warning(self, "警告", f"文件夹 '{folder}' 已在排除列表中")
+                return
             self.exclude_list.addItem(folder)
+            self._exclude_set.add(folder)
     
     def _remove_exclude_folder(self):
         """删除选中的排除文件夹"""
         current_row = self.exclude_list.currentRow()
         if current_row >= 0:
-            self.exclude_list.takeItem(current_row)
+            self._exclude_set.discard(self.exclude_list.takeItem(current_row).text())
         else:
             QMessageBox.warning(self, "警告", "请先选择要删除的文件夹")
     
     def _load_settings(self):
-        settings = self._read_settings()
+        settings = self._settings = self._read_settings()
         
         ocr_engines = settings.get('ocr_engines', {})
         self.ocr_url_edit.setText(ocr_engines.get('current', {}).get('url', ''))
@@ -2800,12 +3003,11 @@ class PreferencesDialog(QDialog):
         excluded_folders = settings.get('excluded_folders', [])
         for folder in excluded_folders:
             self.exclude_list.addItem(folder)
+        self._exclude_set = set(excluded_folders)
         
         self._on_method_changed(self.parse_method_combo.currentIndex())
     
     def _test_api(self):
-        import requests
-        
         api_url = self.api_url_edit.text().strip()
         api_key = self.api_key_edit.text().strip()
         
@@ -2828,7 +3030,7 @@ class PreferencesDialog(QDialog):
         try:
             from core.proxy import get_proxies
             proxies = get_proxies()
-            response = requests.post(api_url, headers=headers, json=data, timeout=30, proxies=proxies)
+            response = _get_http_session().post(api_url, headers=headers, json=data, timeout=30, proxies=proxies)
             if response.status_code == 200:
                 result = response.json()
                 content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
@@ -2839,7 +3041,6 @@ class PreferencesDialog(QDialog):
             QMessageBox.critical(self, "错误", f"连接失败:\n{e}")
     
     def _test_ocr(self):
-        import requests
         import base64
         
         ocr_url = self.ocr_url_edit.text().strip()
@@ -2888,7 +3089,7 @@ class PreferencesDialog(QDialog):
                     "useChartRecognition": False,
                 }
                 
-                response = requests.post(ocr_url, json=payload, headers=headers, timeout=30)
+                response = _get_http_session().post(ocr_url, json=payload, headers=headers, timeout=30)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -2911,7 +3112,8 @@ class PreferencesDialog(QDialog):
             QMessageBox.warning(self, "警告", "Tesseract不可用，请检查路径设置")
     
     def _save_settings(self):
-        settings = self._read_settings()
+        # 在打开对话框时读到的设置上修改，保存时不再读盘
+        settings = dict(self._settings)
         
         # 收集排除文件夹列表
         excluded_folders = []
@@ -2936,18 +3138,15 @@ class PreferencesDialog(QDialog):
             'excluded_folders': excluded_folders
         })
         self._write_settings(settings)
+        self._settings = settings
         
         self.accept()
         QMessageBox.information(self, "完成", "设置已保存")
     
     def _read_settings(self):
-        config_path = 'preferences.json'
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        settings = _load_preferences()
+        if settings is not None:
+            return settings
         return {
             'ocr_engines': {
                 'current': {'url': '', 'key': ''},
@@ -2964,8 +3163,7 @@ class PreferencesDialog(QDialog):
         }
     
     def _write_settings(self, settings):
-        with open('preferences.json', 'w', encoding='utf-8') as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        _save_preferences(settings)
 
 
 class LiteratureSettingsDialog(QDialog):
@@ -3015,17 +3213,18 @@ class LiteratureSettingsDialog(QDialog):
         self.setLayout(layout)
     
     def _load_settings(self):
-        settings = self._read_settings()
+        settings = self._settings = self._read_settings()
         bibkey_mode = settings.get('bibkey_mode', 'medium')
         idx = self.bibkey_mode_combo.findData(bibkey_mode)
         if idx >= 0:
             self.bibkey_mode_combo.setCurrentIndex(idx)
     
     def _save_settings(self):
-        settings = self._read_settings()
+        settings = dict(self._settings)
         bibkey_mode = self.bibkey_mode_combo.currentData()
         settings['bibkey_mode'] = bibkey_mode
         self._write_settings(settings)
+        self._settings = settings
         
         # 应用BibKey模式到全局
         from core.extractor import set_bibkey_mode
@@ -3035,18 +3234,13 @@ class LiteratureSettingsDialog(QDialog):
         QMessageBox.information(self, "完成", "设置已保存")
     
     def _read_settings(self):
-        config_path = 'preferences.json'
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        settings = _load_preferences()
+        if settings is not None:
+            return settings
         return {'bibkey_mode': 'medium'}
     
     def _write_settings(self, settings):
-        with open('preferences.json', 'w', encoding='utf-8') as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        _save_preferences(settings)
 
 
 class ProxySettingsDialog(QDialog):
@@ -3055,6 +3249,7 @@ class ProxySettingsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("代理设置")
         self.setMinimumWidth(400)
+        self._proxy_nam = None
         self._setup_ui()
         self._load_settings()
     
@@ -3116,7 +3311,7 @@ class ProxySettingsDialog(QDialog):
         self.proxy_settings.setEnabled(index == 1)
     
     def _load_settings(self):
-        settings = self._read_settings()
+        settings = self._settings = self._read_settings()
         self.proxy_enabled.setCurrentIndex(1 if settings.get('proxy_enabled', False) else 0)
         self.proxy_host_edit.setText(settings.get('proxy_host', '127.0.0.1'))
         self.proxy_port_edit.setText(settings.get('proxy_port', '1080'))
@@ -3127,24 +3322,61 @@ class ProxySettingsDialog(QDialog):
         self._on_proxy_changed(self.proxy_enabled.currentIndex())
     
     def _test_proxy(self):
-        """测试代理连接"""
-        import requests
-        
+        """测试代理连接（异步请求，不阻塞界面）"""
         host = self.proxy_host_edit.text().strip() or '127.0.0.1'
         port = self.proxy_port_edit.text().strip() or '1080'
         proxy_type = self.proxy_type_combo.currentText().lower()
         
-        if proxy_type == 'http':
-            proxies = {
-                'http': f'http://{host}:{port}',
-                'https': f'http://{host}:{port}'
-            }
-        else:
-            proxies = {
-                'http': f'{proxy_type}://{host}:{port}',
-                'https': f'{proxy_type}://{host}:{port}'
-            }
+        if proxy_type == 'socks4':
+            # QNetworkProxy 不支持 SOCKS4，仍使用 requests 测试
+            self._test_proxy_requests({
+                'http': f'socks4://{host}:{port}',
+                'https': f'socks4://{host}:{port}'
+            })
+            return
+        
+        try:
+            port_num = int(port)
+        except ValueError:
+            QMessageBox.warning(self, "警告", f"端口无效: {port}")
+            return
+        
+        from PySide6.QtNetwork import QNetworkAccessManager, QNetworkProxy, QNetworkRequest
         
+        if self._proxy_nam is None:
+            self._proxy_nam = QNetworkAccessManager(self)
+        proxy_kind = QNetworkProxy.Socks5Proxy if proxy_type == 'socks5' else QNetworkProxy.HttpProxy
+        self._proxy_nam.setProxy(QNetworkProxy(proxy_kind, host, port_num))
+        
+        request = QNetworkRequest(QUrl('https://httpbin.org/ip'))
+        request.setTransferTimeout(10000)
+        
+        self.proxy_test_btn.setEnabled(False)
+        self.proxy_test_btn.setText("测试中...")
+        reply = self._proxy_nam.get(request)
+        reply.finished.connect(partial(self._on_proxy_test_finished, reply))
+    
+    def _on_proxy_test_finished(self, reply):
+        from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+        
+        self.proxy_test_btn.setEnabled(True)
+        self.proxy_test_btn.setText("测试代理连接")
+        try:
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status is None and reply.error() != QNetworkReply.NoError:
+                QMessageBox.critical(self, "错误", f"代理连接失败:\n{reply.errorString()}")
+            elif status != 200:
+                QMessageBox.warning(self, "警告", f"代理响应异常: {status}")
+            else:
+                try:
+                    origin = json.loads(bytes(reply.readAll())).get('origin', 'unknown')
+                except ValueError:
+                    origin = 'unknown'
+                QMessageBox.information(self, "成功", f"代理连接成功！\n出口IP: {origin}")
+        finally:
+            reply.deleteLater()
+    
+    def _test_proxy_requests(self, proxies):
         try:
             self.proxy_test_btn.setEnabled(False)
             self.proxy_test_btn.setText("测试中...")
@@ -3163,8 +3395,8 @@ class ProxySettingsDialog(QDialog):
             self.proxy_test_btn.setText("测试代理连接")
     
     def _save_settings(self):
-        # 读取现有设置（保留其他设置）
-        settings = self._read_settings()
+        # 保留其他设置（沿用打开对话框时读到的内容）
+        settings = dict(self._settings)
         settings.update({
             'proxy_enabled': self.proxy_enabled.currentIndex() == 1,
             'proxy_host': self.proxy_host_edit.text().strip() or '127.0.0.1',
@@ -3172,6 +3404,7 @@ class ProxySettingsDialog(QDialog):
             'proxy_type': self.proxy_type_combo.currentText()
         })
         self._write_settings(settings)
+        self._settings = settings
         
         # 应用代理设置到全局
         from core.proxy import apply_proxy_settings
@@ -3181,13 +3414,9 @@ class ProxySettingsDialog(QDialog):
         QMessageBox.information(self, "完成", "代理设置已保存")
     
     def _read_settings(self):
-        config_path = 'preferences.json'
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        settings = _load_preferences()
+        if settings is not None:
+            return settings
         return {
             'ocr_engines': {
                 'current': {'url': '', 'key': ''},
@@ -3203,8 +3432,7 @@ class ProxySettingsDialog(QDialog):
         }
     
     def _write_settings(self, settings):
-        with open('preferences.json', 'w', encoding='utf-8') as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        _save_preferences(settings)
 
 
 class JournalImpactDialog(QDialog):
@@ -3225,9 +3453,13 @@ class JournalImpactDialog(QDialog):
         self.stats_label.setStyleSheet("color: gray; font-size: 12px;")
         layout.addWidget(self.stats_label)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["期刊名称", "影响因子", "文献数量"])
+        self.model = ResultTableModel([
+            ("期刊名称", lambda r: r[0]),
+            ("影响因子", lambda r: f"{r[1][1]:.2f}" if r[1][1] is not None else "-"),
+            ("文献数量", lambda r: str(r[1][0])),
+        ], self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -3255,35 +3487,14 @@ class JournalImpactDialog(QDialog):
                 self.stats_label.setText("没有文献数据")
                 return
             
-            journal_stats = {}
-            for paper in papers:
-                venue = (paper.get('venue') or '').strip()
-                if venue:
-                    if venue not in journal_stats:
-                        journal_stats[venue] = {'count': 0, 'if_list': []}
-                    journal_stats[venue]['count'] += 1
-                    if paper.get('impact_factor'):
-                        journal_stats[venue]['if_list'].append(paper['impact_factor'])
-            
-            sorted_journals = sorted(
-                journal_stats.items(),
-                key=lambda x: max(x[1]['if_list']) if x[1]['if_list'] else 0,
-                reverse=True
-            )
+            journal_stats = main_window._paper_stats('venue', _venue_stats)
+            sorted_journals = sorted(journal_stats.items(), key=lambda x: x[1][1] or 0, reverse=True)
             
-            self.table.setRowCount(len(sorted_journals))
-            for row, (venue, stats) in enumerate(sorted_journals):
-                self.table.setItem(row, 0, QTableWidgetItem(venue))
-                if stats['if_list']:
-                    max_if = max(stats['if_list'])
-                    self.table.setItem(row, 1, QTableWidgetItem(f"{max_if:.2f}"))
-                else:
-                    self.table.setItem(row, 1, QTableWidgetItem("-"))
-                self.table.setItem(row, 2, QTableWidgetItem(str(stats['count'])))
+            self.model.set_rows(sorted_journals)
             
             total_journals = len(journal_stats)
             total_papers = len(papers)
-            if_journals = sum(1 for v in journal_stats.values() if v['if_list'])
+            if_journals = sum(1 for stats in journal_stats.values() if stats[1] is not None)
             self.stats_label.setText(f"共 {total_journals} 种期刊，{total_papers} 篇文献，其中 {if_journals} 种期刊有影响因子")
             
         except Exception as e:
@@ -3308,9 +3519,13 @@ class YearlyStatsDialog(QDialog):
         self.stats_label.setStyleSheet("color: gray; font-size: 12px;")
         layout.addWidget(self.stats_label)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["年份", "论文数", "占比"])
+        self.model = ResultTableModel([
+            ("年份", lambda r: str(r[0])),
+            ("论文数", lambda r: str(r[1])),
+            ("占比", lambda r: f"{r[1] * self._pct_scale:.1f}%"),
+        ], self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
@@ -3342,27 +3557,16 @@ class YearlyStatsDialog(QDialog):
                 self.stats_label.setText("没有文献数据")
                 return
             
-            yearly_stats = {}
-            for paper in papers:
-                year = paper.get('year')
-                if year:
-                    if year not in yearly_stats:
-                        yearly_stats[year] = 0
-                    yearly_stats[year] += 1
+            sorted_years = main_window._paper_stats('year', _year_counts)
+            total = sum(count for _, count in sorted_years)
             
-            sorted_years = sorted(yearly_stats.items(), key=lambda x: x[0], reverse=True)
-            total = sum(yearly_stats.values())
-            
-            self.table.setRowCount(len(sorted_years))
-            for row, (year, count) in enumerate(sorted_years):
-                self.table.setItem(row, 0, QTableWidgetItem(str(year)))
-                self.table.setItem(row, 1, QTableWidgetItem(str(count)))
-                percentage = count / total * 100 if total > 0 else 0
-                self.table.setItem(row, 2, QTableWidgetItem(f"{percentage:.1f}%"))
+            self.total = total
+            # 占比 = 数量 × 100/总数，除法只做一次
+            self._pct_scale = 100.0 / total if total > 0 else 0.0
+            self.yearly_data = sorted_years
+            self.model.set_rows(sorted_years)
             
             self.stats_label.setText(f"共 {total} 篇文献，涵盖 {len(sorted_years)} 个年份")
-            self.yearly_data = sorted_years
-            self.total = total
         
         except Exception as e:
             self.stats_label.setText(f"加载失败: {e}")
@@ -3371,16 +3575,17 @@ class YearlyStatsDialog(QDialog):
         if not hasattr(self, 'yearly_data'):
             return
         
-        lines = ["# 年度发文统计\n", f"总计: {self.total} 篇文献\n\n", "| 年份 | 论文数 | 占比 |", "|-----|-------|-----|"]
-        for year, count in self.yearly_data:
-            percentage = count / self.total * 100 if self.total > 0 else 0
-            lines.append(f"| {year} | {count} | {percentage:.1f}% |")
-        
-        content = "\n".join(lines)
         path, _ = QFileDialog.getSaveFileName(self, "保存Markdown", "yearly_stats.md", "Markdown Files (*.md)")
         if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            total = self.total
+            scale = self._pct_scale
+            # 逐行写入，不在内存中拼出整份文档
+            with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(f"# 年度发文统计\n\n总计: {total} 篇文献\n\n\n| 年份 | 论文数 | 占比 |\n|-----|-------|-----|\n")
+                f.writelines(
+                    f"| {year} | {count} | {count * scale:.1f}% |\n"
+                    for year, count in self.yearly_data
+                )
             QMessageBox.information(self, "完成", "Markdown 已导出")
 
 
@@ -3402,9 +3607,14 @@ class JournalDistributionDialog(QDialog):
         self.stats_label.setStyleSheet("color: gray; font-size: 12px;")
         layout.addWidget(self.stats_label)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["期刊名称", "论文数", "占比", "平均IF"])
+        self.model = ResultTableModel([
+            ("期刊名称", lambda r: r[0]),
+            ("论文数", lambda r: str(r[1][0])),
+            ("占比", lambda r: f"{r[1][0] * self._pct_scale:.1f}%"),
+            ("平均IF", lambda r: f"{r[1][2] / r[1][3]:.2f}" if r[1][3] > 0 else "-"),
+        ], self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -3437,32 +3647,16 @@ class JournalDistributionDialog(QDialog):
                 self.stats_label.setText("没有文献数据")
                 return
             
-            journal_stats = {}
-            for paper in papers:
-                venue = (paper.get('venue') or '').strip()
-                if venue:
-                    if venue not in journal_stats:
-                        journal_stats[venue] = {'count': 0, 'if_sum': 0, 'if_count': 0}
-                    journal_stats[venue]['count'] += 1
-                    if paper.get('impact_factor'):
-                        journal_stats[venue]['if_sum'] += paper['impact_factor']
-                        journal_stats[venue]['if_count'] += 1
-            
-            sorted_journals = sorted(journal_stats.items(), key=lambda x: x[1]['count'], reverse=True)
+            journal_stats = main_window._paper_stats('venue', _venue_stats)
+            sorted_journals = sorted(journal_stats.items(), key=lambda x: x[1][0], reverse=True)
             total = len(papers)
             
-            self.table.setRowCount(len(sorted_journals))
-            for row, (venue, stats) in enumerate(sorted_journals):
-                self.table.setItem(row, 0, QTableWidgetItem(venue))
-                self.table.setItem(row, 1, QTableWidgetItem(str(stats['count'])))
-                percentage = stats['count'] / total * 100 if total > 0 else 0
-                self.table.setItem(row, 2, QTableWidgetItem(f"{percentage:.1f}%"))
-                avg_if = stats['if_sum'] / stats['if_count'] if stats['if_count'] > 0 else 0
-                self.table.setItem(row, 3, QTableWidgetItem(f"{avg_if:.2f}" if avg_if > 0 else "-"))
+            self.total = total
+            self._pct_scale = 100.0 / total if total > 0 else 0.0
+            self.journal_data = sorted_journals
+            self.model.set_rows(sorted_journals)
             
             self.stats_label.setText(f"共 {len(journal_stats)} 种期刊，{total} 篇文献")
-            self.journal_data = sorted_journals
-            self.total = total
         
         except Exception as e:
             self.stats_label.setText(f"加载失败: {e}")
@@ -3471,28 +3665,34 @@ class JournalDistributionDialog(QDialog):
         if not hasattr(self, 'journal_data'):
             return
         
-        lines = ["# 期刊分布统计\n", f"总计: {self.total} 篇文献\n\n", "| 期刊 | 论文数 | 占比 | 平均IF |", "|-----|-------|-----|-----|"]
-        for venue, stats in self.journal_data:
-            percentage = stats['count'] / self.total * 100 if self.total > 0 else 0
-            avg_if = stats['if_sum'] / stats['if_count'] if stats['if_count'] > 0 else 0
-            if_str = f"{avg_if:.2f}" if avg_if > 0 else "-"
-            lines.append(f"| {venue} | {stats['count']} | {percentage:.1f}% | {if_str} |")
-        
-        content = "\n".join(lines)
         path, _ = QFileDialog.getSaveFileName(self, "保存Markdown", "journal_distribution.md", "Markdown Files (*.md)")
         if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            total = self.total
+            scale = self._pct_scale
+            
+            def rows():
+                for venue, (count, _, if_sum, if_count) in self.journal_data:
+                    percentage = count * scale
+                    if_str = f"{if_sum / if_count:.2f}" if if_count > 0 else "-"
+                    yield f"| {venue} | {count} | {percentage:.1f}% | {if_str} |\n"
+            
+            with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(f"# 期刊分布统计\n\n总计: {total} 篇文献\n\n\n| 期刊 | 论文数 | 占比 | 平均IF |\n|-----|-------|-----|-----|\n")
+                f.writelines(rows())
             QMessageBox.information(self, "完成", "Markdown 已导出")
 
 
 class TypeDistributionDialog(QDialog):
     """类型分布统计对话框"""
+    # 对话框以模态方式打开，同一时刻只有一个画布使用，Figure 可在各次打开间复用
+    _shared_fig = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("类型分布统计")
         self.setMinimumWidth(600)
         self.setMinimumHeight(450)
+        self._canvas = None
         self._setup_ui()
         self._load_data()
     
@@ -3548,8 +3748,8 @@ class TypeDistributionDialog(QDialog):
     
     def _draw_pie_chart(self):
         try:
-            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-            from matplotlib.figure import Figure
+            if FigureCanvas is None:
+                return
             
             types = ['论文', '专利', '软著']
             counts = [self.paper_count, self.patent_count, self.software_count]
@@ -3557,7 +3757,11 @@ class TypeDistributionDialog(QDialog):
             if sum(counts) == 0:
                 return
             
-            fig = Figure(figsize=(5, 4), dpi=100)
+            fig = TypeDistributionDialog._shared_fig
+            if fig is None:
+                fig = TypeDistributionDialog._shared_fig = Figure(figsize=(5, 4), dpi=100)
+            else:
+                fig.clear()
             ax = fig.add_subplot(111)
             
             colors = ['#2196F3', '#4CAF50', '#FF9800']
@@ -3579,24 +3783,29 @@ class TypeDistributionDialog(QDialog):
             
             ax.set_title('科研成果类型分布', fontsize=14, fontweight='bold')
             
-            canvas = FigureCanvas(fig)
-            canvas.setParent(self.chart_frame)
-            
-            layout = QVBoxLayout(self.chart_frame)
-            layout.addWidget(canvas)
-            layout.setContentsMargins(0, 0, 0, 0)
+            if self._canvas is None:
+                self._canvas = FigureCanvas(fig)
+                self._canvas.setParent(self.chart_frame)
+                
+                layout = QVBoxLayout(self.chart_frame)
+                layout.addWidget(self._canvas)
+                layout.setContentsMargins(0, 0, 0, 0)
+            else:
+                self._canvas.draw_idle()
         
         except Exception as e:
-            print(f"Chart drawing error: {e}")
+            logger.error(f"Chart drawing error: {e}", exc_info=True)
+            self.stats_label.setText(f"{self.stats_label.text()} | 图表绘制失败: {e}")
     
     def _export_markdown(self):
         total = self.paper_count + self.patent_count + self.software_count
         
         lines = ["# 类型分布统计\n\n"]
         if total > 0:
-            lines.append(f"- 论文: {self.paper_count} 篇 ({self.paper_count/total*100:.1f}%)")
-            lines.append(f"- 专利: {self.patent_count} 项 ({self.patent_count/total*100:.1f}%)")
-            lines.append(f"- 软著: {self.software_count} 个 ({self.software_count/total*100:.1f}%)")
+            scale = 100.0 / total
+            lines.append(f"- 论文: {self.paper_count} 篇 ({self.paper_count * scale:.1f}%)")
+            lines.append(f"- 专利: {self.patent_count} 项 ({self.patent_count * scale:.1f}%)")
+            lines.append(f"- 软著: {self.software_count} 个 ({self.software_count * scale:.1f}%)")
             lines.append(f"\n总计: {total}")
         else:
             lines.append("- 论文: 0 篇")
@@ -3611,12 +3820,36 @@ class TypeDistributionDialog(QDialog):
             QMessageBox.information(self, "完成", "Markdown 已导出")
 
 
+class FulltextSearchThread(QThread):
+    """在后台执行全文搜索"""
+    results = Signal(list)
+    error = Signal(str)
+    
+    def __init__(self, db, keyword):
+        super().__init__()
+        self.db = db
+        self.keyword = keyword
+    
+    def run(self):
+        try:
+            results = self.db.search_fulltext(self.keyword)
+        except Exception as e:
+            logger.error(f"Fulltext search failed: {e}")
+            self.error.emit(str(e))
+            return
+        self.results.emit(results)
+
+
 class FulltextSearchDialog(QDialog):
     """全文搜索对话框"""
+    CLOSE_WAIT_MS = 3000
+    
     def __init__(self, db, root_dir, parent=None):
         super().__init__(parent)
         self.db = db
         self.root_dir = root_dir
+        # 同一时间只运行一个搜索，结束前禁用搜索按钮
+        self._search_thread = None
         self.setWindowTitle("全文搜索")
         self.setMinimumWidth(800)
         self.setMinimumHeight(500)
@@ -3643,12 +3876,16 @@ class FulltextSearchDialog(QDialog):
         self.stats_label.setStyleSheet("color: gray; font-size: 11px;")
         layout.addWidget(self.stats_label)
         
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(4)
-        self.result_table.setHorizontalHeaderLabels(["标题", "作者", "年份", "匹配内容"])
+        self.result_model = ResultTableModel([
+            ("标题", lambda r: r.get('title') or r.get('filename') or ''),
+            ("作者", lambda r: r.get('authors') or ''),
+            ("年份", lambda r: str(r.get('year') or '')),
+            ("匹配内容", lambda r: f"...{(r.get('snippet') or '').translate(_NL_TO_SPACE)}..."),
+        ], self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         self.result_table.horizontalHeader().setStretchLastSection(True)
-        self.result_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.result_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.result_table.setSelectionBehavior(QTableView.SelectRows)
         self.result_table.doubleClicked.connect(self._open_file)
         self.result_table.setColumnWidth(0, 250)
         self.result_table.setColumnWidth(1, 150)
@@ -3671,59 +3908,52 @@ class FulltextSearchDialog(QDialog):
     
     def _do_search(self):
         keyword = self.search_input.text().strip()
-        if not keyword:
+        # 回车键不受按钮禁用影响，这里同样拒绝重叠的搜索
+        if not keyword or self._search_thread:
             return
         
-        self.search_btn.setText("搜索中...")
         self.search_btn.setEnabled(False)
-        QApplication.processEvents()
+        self.search_btn.setText("搜索中...")
         
-        try:
-            results = self.db.search_fulltext(keyword)
-            self.result_table.setRowCount(len(results))
-            
-            for i, r in enumerate(results):
-                title_item = QTableWidgetItem(r.get('title') or r.get('filename') or '')
-                self.result_table.setItem(i, 0, title_item)
-                
-                authors_item = QTableWidgetItem(r.get('authors') or '')
-                self.result_table.setItem(i, 1, authors_item)
-                
-                year_item = QTableWidgetItem(str(r.get('year') or ''))
-                self.result_table.setItem(i, 2, year_item)
-                
-                content = r.get('content') or ''
-                match_pos = r.get('match_pos', 0)
-                if match_pos > 0:
-                    start = max(0, match_pos - 50)
-                    end = min(len(content), match_pos + len(keyword) + 50)
-                    snippet = '...' + content[start:end].replace('\n', ' ') + '...'
-                else:
-                    idx = content.lower().find(keyword.lower())
-                    if idx >= 0:
-                        start = max(0, idx - 50)
-                        end = min(len(content), idx + len(keyword) + 50)
-                        snippet = '...' + content[start:end].replace('\n', ' ') + '...'
-                    else:
-                        snippet = content[:100].replace('\n', ' ') + '...'
-                
-                snippet_item = QTableWidgetItem(snippet)
-                self.result_table.setItem(i, 3, snippet_item)
-                
-                self.result_table.item(i, 0).setData(Qt.UserRole, r.get('rel_path'))
-            
-            self.stats_label.setText(f"找到 {len(results)} 个结果")
-        finally:
-            self.search_btn.setText("搜索")
-            self.search_btn.setEnabled(True)
+        thread = FulltextSearchThread(self.db, keyword)
+        thread.results.connect(self._on_search_results, Qt.QueuedConnection)
+        thread.error.connect(self._on_search_error, Qt.QueuedConnection)
+        thread.finished.connect(lambda: self._on_search_thread_finished(thread))
+        self._search_thread = thread
+        thread.start()
+    
+    def _on_search_results(self, results):
+        self.result_model.set_rows(results)
+        self.stats_label.setText(f"找到 {len(results)} 个结果")
+    
+    def _on_search_error(self, message):
+        QMessageBox.critical(self, "错误", f"搜索失败: {message}")
+    
+    def _on_search_thread_finished(self, thread):
+        if self._search_thread is thread:
+            self._search_thread = None
+        thread.deleteLater()
+        self.search_btn.setEnabled(True)
+        self.search_btn.setText("搜索")
+    
+    def done(self, result):
+        # 关闭前等待搜索线程结束；超时（数据库长时间被占用）则交给主窗口持有，结束后自行释放
+        thread = self._search_thread
+        if thread and not thread.wait(self.CLOSE_WAIT_MS):
+            logger.warning("Fulltext search still running while closing the search dialog")
+            thread.results.disconnect(self._on_search_results)
+            thread.error.disconnect(self._on_search_error)
+            thread.setParent(self.parent())
+        super().done(result)
     
     def _open_file(self, index):
-        row = index.row()
-        rel_path = self.result_table.item(row, 0).data(Qt.UserRole)
+        result = self.result_model.row_at(index.row())
+        rel_path = result.get('rel_path') if result else None
         if rel_path:
-            abs_path = os.path.join(self.root_dir, rel_path) if not os.path.isabs(rel_path) else rel_path
+            abs_path = _resolve_pdf_path(self.root_dir, rel_path)
             if os.path.exists(abs_path):
-                os.startfile(abs_path)
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                    QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
 
 
 class TagManagerDialog(QDialog):
@@ -3802,34 +4032,195 @@ class TagManagerDialog(QDialog):
                 item.setData(Qt.UserRole, tag['id'])
                 self.all_tags_list.addItem(item)
     
+    def _find_tag_row(self, list_widget, tag_id):
+        for row in range(list_widget.count()):
+            if list_widget.item(row).data(Qt.UserRole) == tag_id:
+                return row
+        return -1
+    
+    def _show_as_current(self, tag_id, tag_name):
+        """把已添加的标签移入当前标签列表，不再重新查询数据库"""
+        if self._find_tag_row(self.current_tags_list, tag_id) >= 0:
+            return
+        row = self._find_tag_row(self.all_tags_list, tag_id)
+        if row >= 0:
+            self.all_tags_list.takeItem(row)
+        item = QListWidgetItem(tag_name)
+        item.setData(Qt.UserRole, tag_id)
+        # 插入到按名称排序的位置，与 _load_tags 的 ORDER BY name 一致
+        names = [self.current_tags_list.item(i).text() for i in range(self.current_tags_list.count())]
+        self.current_tags_list.insertItem(bisect_right(names, tag_name), item)
+    
     def _add_tag(self):
         tag_name = self.new_tag_input.text().strip()
         if tag_name:
             tag_id = self.db.get_or_create_tag(tag_name)
             self.db.add_tag_to_paper(self.paper_id, tag_id)
             self.new_tag_input.clear()
-            self._load_tags()
+            self._show_as_current(tag_id, tag_name)
     
     def _add_existing_tag(self, item):
         tag_id = item.data(Qt.UserRole)
         self.db.add_tag_to_paper(self.paper_id, tag_id)
-        self._load_tags()
+        self._show_as_current(tag_id, item.text())
     
     def _remove_tags(self):
-        for item in self.current_tags_list.selectedItems():
-            tag_id = item.data(Qt.UserRole)
-            self.db.remove_tag_from_paper(self.paper_id, tag_id)
+        tag_ids = [item.data(Qt.UserRole) for item in self.current_tags_list.selectedItems()]
+        if tag_ids:
+            self.db.remove_tags_from_paper(self.paper_id, tag_ids)
         self._load_tags()
 
 
+# 摘要提取模式，按优先级排列：依次尝试，取第一个长度合理的结果。
+# 不能合并成一个交替式，否则会按出现位置而不是优先级返回匹配
+_ABSTRACT_PATTERNS = tuple(re.compile(p, re.DOTALL | re.MULTILINE) for p in (
+    # Elsevier style: a b s t r a c t (with spaces)
+    r'(?i)a\s*b\s*s\s*t\s*r\s*a\s*c\s*t\s*\n(.*?)(?=\n\s*(?:\d+\.\s*Introduction|1\.\s*Introduction))',
+    # IEEE style with Manuscript received ending
+    r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\s*(?:Manuscript\s*received|Note\s*to\s*Practitioners|Index\s*Terms|Keywords?|Key\s*Words?|I\.\s*INTRODUCTION|1\s*[\.\)]\s*Introduction))',
+    # Standard: Abstract followed by text
+    r'(?i)Abstract[:\s]*\n(.*?)(?=\n\s*(?:Keywords?|Key\s*Words?|Introduction|1\s*[\.\)]|I\s*[\.\)]|Index\s*Terms?|CCS))',
+    # Abstract with double newline ending
+    r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\s*\n\s*(?:I\.|1\.|Keywords|Index|Note\s*to|Manuscript))',
+    # Chinese: 摘要
+    r'(?:\u6458\s*\u8981|\u6458\u8981)[\uff1a:\s]*(.*?)(?=\n\s*(?:\u5173\u952e\u8bcd|\u5173\s*\u952e\s*\u8bcd|\u5f15\u8a00|1\s*[\.\)]|\u4e00\u3001|0\s*\u5f15\u8a00))',
+    r'(?:\u6458\s*\u8981|\u6458\u8981)[\uff1a:\s]*(.*?)(?=\n\s*\n)',
+    # Fallback: Abstract to double newline
+    r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\n)',
+))
+# 上面每个模式都以这两种标题之一开头：先扫描一遍定位第一个标题，没有标题时不必再逐个尝试
+_ABSTRACT_MARKER_RE = re.compile(r'(?i)a\s*b\s*s\s*t\s*r\s*a\s*c\s*t|\u6458\s*\u8981')
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_DASH_RE = re.compile(r'^[\u2014\u2013\-\s]+')
+
+
+def _find_abstract(full_text: str, patterns=_ABSTRACT_PATTERNS) -> Optional[str]:
+    """从PDF前几页文本中找出摘要（依次尝试 patterns），找不到时返回 None"""
+    marker = _ABSTRACT_MARKER_RE.search(full_text)
+    if not marker:
+        return None
+    # 任何匹配都不会早于第一个标题，从标题处开始搜索结果不变
+    start = marker.start()
+    for pattern in patterns:
+        match = pattern.search(full_text, start)
+        if match:
+            # 清理多余空白，移除开头的特殊字符
+            abstract = _WHITESPACE_RE.sub(' ', match.group(1).strip())
+            abstract = _LEADING_DASH_RE.sub('', abstract)
+            if 50 < len(abstract) < 3000:  # 确保摘要有足够内容且不过长
+                return abstract
+    return None
+
+
+def _read_abstract(abs_path: str) -> Tuple[Optional[str], str]:
+    """读取PDF前几页查找摘要，返回 (摘要或None, 已读取的文本)"""
+    if fitz is None:
+        raise RuntimeError("未安装 PyMuPDF，无法读取PDF")
+    # 不保留连字和原始空白，并合并行尾连字符断开的单词：MuPDF 工作更少，摘要也不会被断词
+    flags = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
+    full_text = ""
+    abstract = None
+    # 读取出错时也会关闭文件
+    with fitz.open(abs_path) as doc:
+        for page_num in range(min(3, doc.page_count)):
+            text = doc[page_num].get_text("text", flags=flags)
+            full_text += text + "\n"
+            # 最高优先级模式的结果不会因后续页面而改变，命中即可停止解析；
+            # 其余模式可能被后续页面中更高优先级的匹配取代，需读完再统一判断
+            abstract = _find_abstract(full_text, _ABSTRACT_PATTERNS[:1])
+            if abstract:
+                return abstract, full_text
+    return _find_abstract(full_text), full_text
+
+
+@lru_cache(maxsize=1024)
+def _resolve_pdf_path(root_dir: str, file_path: str) -> str:
+    """数据库中的PDF路径（相对根目录或绝对路径）转为绝对路径。
+    只缓存路径拼接；文件可能被重命名或移动，是否存在仍需每次检查"""
+    return file_path if os.path.isabs(file_path) else os.path.join(root_dir, file_path)
+
+
+def _ellipsize(text: str, width: int) -> str:
+    """超过 width 个字符时截断并以 … 结尾"""
+    return text if len(text) <= width else text[:width - 1] + '…'
+
+
+class AbstractExtractThread(QThread):
+    """在后台从PDF提取摘要；文件未修改时直接使用上次提取的结果"""
+    extracted = Signal(int, str, str)
+    error = Signal(int, str)
+    
+    def __init__(self, db, paper_id, file_path, abs_path):
+        super().__init__()
+        self.db = db
+        self.paper_id = paper_id
+        self.file_path = file_path
+        self.abs_path = abs_path
+    
+    def run(self):
+        preview = ""
+        try:
+            mtime = os.path.getmtime(self.abs_path)
+            abstract = self.db.get_cached_abstract(self.file_path, mtime)
+            if abstract is None:
+                abstract, full_text = _read_abstract(self.abs_path)
+                if abstract:
+                    self.db.set_cached_abstract(self.file_path, mtime, abstract)
+                else:
+                    preview = full_text[:500].strip()
+        except Exception as e:
+            logger.error(f"Abstract extraction failed for {self.abs_path}: {e}")
+            self.error.emit(self.paper_id, str(e))
+            return
+        self.extracted.emit(self.paper_id, abstract or "", preview)
+
+
+class PaperSaveThread(QThread):
+    """在后台把摘要和笔记写入数据库；失败时错误信息记录在 error 中，由 finished 的槽函数读取"""
+    
+    def __init__(self, db, paper, abstract, notes, attempt=1):
+        super().__init__()
+        self.db = db
+        self.paper = paper
+        self.abstract = abstract
+        self.notes = notes
+        # 第几次尝试写入这份内容
+        self.attempt = attempt
+        self.error = None
+    
+    def run(self):
+        try:
+            self.db.update_paper(
+                self.paper['id'],
+                abstract=self.abstract or None,
+                notes=self.notes or None
+            )
+        except Exception as e:
+            logger.error(f"Saving paper {self.paper['id']} failed: {e}")
+            self.error = str(e)
+
+
 class PaperDetailViewDialog(QDialog):
     """论文详情查看对话框"""
+    # 写入失败时的重试次数与间隔；关闭时等待写入线程的最长时间（大于 SQLite 的 5 秒忙等待）
+    SAVE_MAX_ATTEMPTS = 3
+    SAVE_RETRY_MS = 1000
+    CLOSE_WAIT_MS = 8000
     def __init__(self, db, papers, root_dir, parent=None):
         super().__init__(parent)
         self.db = db
-        self.papers = papers
+        # 保存时会更新行中的摘要和笔记；传入的行与查询缓存共享，使用各自的副本
+        self.papers = [dict(paper) for paper in papers]
         self.root_dir = root_dir
         self.current_paper = None
+        self._extract_thread = None
+        # 同一时间只有一个保存线程；等待写入的内容每篇论文只保留最新的一份：
+        # 论文id -> (论文, 摘要, 笔记, 第几次尝试)
+        self._save_thread = None
+        self._pending_saves = {}
+        self._closed = False
+        # 摘要或笔记有尚未写入数据库的修改
+        self._dirty = False
         self.setWindowTitle("论文详情")
         self.setMinimumWidth(900)
         self.setMinimumHeight(600)
@@ -3852,6 +4243,8 @@ class PaperDetailViewDialog(QDialog):
         
         self.paper_list = QListWidget()
         self.paper_list.setMinimumWidth(300)
+        # 各项行高相同，布局时不必逐项计算尺寸
+        self.paper_list.setUniformItemSizes(True)
         self.paper_list.currentRowChanged.connect(self._on_paper_selected)
         self.paper_list.itemDoubleClicked.connect(self._open_paper_pdf)
         left_layout.addWidget(self.paper_list)
@@ -3895,6 +4288,14 @@ class PaperDetailViewDialog(QDialog):
         notes_group.setLayout(notes_layout)
         right_layout.addWidget(notes_group)
         
+        # 编辑停止 500ms 后自动保存，连续输入只写一次数据库
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_current)
+        self.abstract_edit.textChanged.connect(self._on_text_edited)
+        self.notes_edit.textChanged.connect(self._on_text_edited)
+        
         # 按钮区域
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -3918,23 +4319,26 @@ class PaperDetailViewDialog(QDialog):
         self.setLayout(layout)
     
     def _load_papers(self):
-        self.paper_list.clear()
-        for i, paper in enumerate(self.papers):
-            title = paper.get('title') or '(无标题)'
-            authors = paper.get('authors') or '(无作者)'
-            # 截断过长的标题和作者
-            if len(title) > 50:
-                title = title[:47] + '...'
-            if len(authors) > 30:
-                authors = authors[:27] + '...'
-            
-            item_text = f"{i+1}. {title}\n   {authors}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, i)
+        # 填充期间暂停重绘和信号，结束后统一刷新一次
+        self.paper_list.setUpdatesEnabled(False)
+        self.paper_list.blockSignals(True)
+        try:
+            self.paper_list.clear()
             # 增加行高，使不同论文之间更容易区分
-            from PySide6.QtCore import QSize
-            item.setSizeHint(QSize(0, 55))
-            self.paper_list.addItem(item)
+            size_hint = QSize(0, 55)
+            for i, paper in enumerate(self.papers):
+                # 截断过长的标题和作者
+                title = _ellipsize(paper.get('title') or '(无标题)', 50)
+                authors = _ellipsize(paper.get('authors') or '(无作者)', 30)
+                
+                item_text = f"{i+1}. {title}\n   {authors}"
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.UserRole, i)
+                item.setSizeHint(size_hint)
+                self.paper_list.addItem(item)
+        finally:
+            self.paper_list.blockSignals(False)
+            self.paper_list.setUpdatesEnabled(True)
         
         if self.papers:
             self.paper_list.setCurrentRow(0)
@@ -3943,11 +4347,15 @@ class PaperDetailViewDialog(QDialog):
         if row < 0 or row >= len(self.papers):
             return
         
+        # 先保存上一篇论文尚未写入的修改
+        self._flush_pending_save()
         self.current_paper = self.papers[row]
         
-        # 加载摘要和笔记
-        self.abstract_edit.setPlainText(self.current_paper.get('abstract') or '')
-        self.notes_edit.setPlainText(self.current_paper.get('notes') or '')
+        # 加载摘要和笔记（不触发自动保存）
+        for edit, field in ((self.abstract_edit, 'abstract'), (self.notes_edit, 'notes')):
+            edit.blockSignals(True)
+            edit.setPlainText(self.current_paper.get(field) or '')
+            edit.blockSignals(False)
         
         self.status_label.setText(f"当前: {self.current_paper.get('title', '')[:50]}")
     
@@ -3964,12 +4372,10 @@ class PaperDetailViewDialog(QDialog):
             self.status_label.setStyleSheet("color: orange;")
             return
         
-        abs_path = os.path.join(self.root_dir, file_path) if not os.path.isabs(file_path) else file_path
+        abs_path = _resolve_pdf_path(self.root_dir, file_path)
         if os.path.exists(abs_path):
-            try:
-                os.startfile(abs_path)
-            except Exception as e:
-                self.status_label.setText(f"打开失败: {e}")
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                self.status_label.setText(f"打开失败: {abs_path}")
                 self.status_label.setStyleSheet("color: red;")
         else:
             self.status_label.setText(f"文件不存在: {abs_path}")
@@ -3985,7 +4391,12 @@ class PaperDetailViewDialog(QDialog):
             self.status_label.setStyleSheet("color: orange;")
             return
         
-        abs_path = os.path.join(self.root_dir, file_path) if not os.path.isabs(file_path) else file_path
+        if fitz is None:
+            self.status_label.setText("未安装 PyMuPDF，无法提取摘要")
+            self.status_label.setStyleSheet("color: red;")
+            return
+        
+        abs_path = _resolve_pdf_path(self.root_dir, file_path)
         if not os.path.exists(abs_path):
             self.status_label.setText(f"文件不存在: {abs_path}")
             self.status_label.setStyleSheet("color: red;")
@@ -3993,94 +4404,149 @@ class PaperDetailViewDialog(QDialog):
         
         self.extract_abstract_btn.setEnabled(False)
         self.extract_abstract_btn.setText("提取中...")
-        QApplication.processEvents()
-        
-        try:
-            import fitz
-            doc = fitz.open(abs_path)
-            
-            # 尝试从前几页提取摘要
-            abstract = None
-            full_text = ""
-            
-            for page_num in range(min(3, len(doc))):
-                page = doc[page_num]
-                text = page.get_text()
-                full_text += text + "\n"
-            
-            doc.close()
-            
-            # 尝试找到Abstract部分
-            import re
-            
-            # 改进的摘要提取模式
-            abstract_patterns = [
-                # Elsevier style: a b s t r a c t (with spaces)
-                r'(?i)a\s*b\s*s\s*t\s*r\s*a\s*c\s*t\s*\n(.*?)(?=\n\s*(?:\d+\.\s*Introduction|1\.\s*Introduction))',
-                # IEEE style with Manuscript received ending
-                r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\s*(?:Manuscript\s*received|Note\s*to\s*Practitioners|Index\s*Terms|Keywords?|Key\s*Words?|I\.\s*INTRODUCTION|1\s*[\.\)]\s*Introduction))',
-                # Standard: Abstract followed by text
-                r'(?i)Abstract[:\s]*\n(.*?)(?=\n\s*(?:Keywords?|Key\s*Words?|Introduction|1\s*[\.\)]|I\s*[\.\)]|Index\s*Terms?|CCS))',
-                # Abstract with double newline ending
-                r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\s*\n\s*(?:I\.|1\.|Keywords|Index|Note\s*to|Manuscript))',
-                # Chinese: 摘要
-                r'(?:\u6458\s*\u8981|\u6458\u8981)[\uff1a:\s]*(.*?)(?=\n\s*(?:\u5173\u952e\u8bcd|\u5173\s*\u952e\s*\u8bcd|\u5f15\u8a00|1\s*[\.\)]|\u4e00\u3001|0\s*\u5f15\u8a00))',
-                r'(?:\u6458\s*\u8981|\u6458\u8981)[\uff1a:\s]*(.*?)(?=\n\s*\n)',
-                # Fallback: Abstract to double newline
-                r'(?i)Abstract[\u2014\u2013\-:;\s]+(.*?)(?=\n\n)',
-            ]
-            
-            for pattern in abstract_patterns:
-                match = re.search(pattern, full_text, re.DOTALL | re.MULTILINE)
-                if match:
-                    abstract = match.group(1).strip()
-                    # 清理多余空白
-                    abstract = re.sub(r'\s+', ' ', abstract)
-                    # 移除开头的特殊字符
-                    abstract = re.sub(r'^[\u2014\u2013\-\s]+', '', abstract)
-                    if 50 < len(abstract) < 3000:  # 确保摘要有足够内容且不过长
-                        break
-                    else:
-                        abstract = None
-            
-            if abstract:
-                self.abstract_edit.setPlainText(abstract)
-                self.status_label.setText(f"已提取摘要 ({len(abstract)} 字符)")
-                self.status_label.setStyleSheet("color: green;")
-            else:
-                # 如果没找到明确的摘要，取前500字符
-                preview = full_text[:500].strip()
-                self.abstract_edit.setPlainText(preview)
-                self.status_label.setText("未找到明确摘要，已提取前500字符")
-                self.status_label.setStyleSheet("color: orange;")
         
-        except Exception as e:
-            self.status_label.setText(f"提取失败: {e}")
-            self.status_label.setStyleSheet("color: red;")
-        finally:
-            self.extract_abstract_btn.setEnabled(True)
-            self.extract_abstract_btn.setText("从PDF提取")
+        thread = AbstractExtractThread(self.db, self.current_paper['id'], file_path, abs_path)
+        thread.extracted.connect(self._on_abstract_extracted, Qt.QueuedConnection)
+        thread.error.connect(self._on_abstract_error, Qt.QueuedConnection)
+        thread.finished.connect(lambda: self._on_extract_thread_finished(thread))
+        self._extract_thread = thread
+        thread.start()
+    
+    def _on_abstract_extracted(self, paper_id, abstract, preview):
+        # 提取期间已切换到其他论文时丢弃结果
+        if not self.current_paper or self.current_paper['id'] != paper_id:
+            return
+        if abstract:
+            self.abstract_edit.setPlainText(abstract)
+            self.status_label.setText(f"已提取摘要 ({len(abstract)} 字符)")
+            self.status_label.setStyleSheet("color: green;")
+        else:
+            # 如果没找到明确的摘要，取前500字符
+            self.abstract_edit.setPlainText(preview)
+            self.status_label.setText("未找到明确摘要，已提取前500字符")
+            self.status_label.setStyleSheet("color: orange;")
+    
+    def _on_abstract_error(self, paper_id, message):
+        self.status_label.setText(f"提取失败: {message}")
+        self.status_label.setStyleSheet("color: red;")
+    
+    def _on_extract_thread_finished(self, thread):
+        if self._extract_thread is thread:
+            self._extract_thread = None
+        thread.deleteLater()
+        self.extract_abstract_btn.setEnabled(True)
+        self.extract_abstract_btn.setText("从PDF提取")
+    
+    def done(self, result):
+        # 关闭前等待摘要提取线程结束，并保存尚未写入的修改
+        if self._extract_thread:
+            self._extract_thread.wait()
+        self._flush_pending_save()
+        self._closed = True
+        thread = self._save_thread
+        if thread:
+            if not thread.wait(self.CLOSE_WAIT_MS):
+                # 数据库长时间被占用：线程交给主窗口持有，结束后自行释放；排队的修改不再写入，避免顺序颠倒
+                logger.warning("Paper save still running while closing the detail dialog")
+                thread.setParent(self.parent())
+                if self._pending_saves:
+                    QMessageBox.warning(self, "保存失败", "数据库忙，部分修改未能保存")
+                super().done(result)
+                return
+            # 其 finished 槽函数在关闭后不再处理结果，这里直接处理
+            if thread.error is None:
+                thread.paper['abstract'] = thread.abstract
+                thread.paper['notes'] = thread.notes
+            elif thread.paper['id'] not in self._pending_saves:
+                self._pending_saves[thread.paper['id']] = (
+                    thread.paper, thread.abstract, thread.notes, thread.attempt)
+        # 剩余修改（每篇论文至多一份）直接写入，每次写入最多等待 SQLite 的忙等待时间
+        failed = []
+        for paper, abstract, notes, _ in self._pending_saves.values():
+            try:
+                self.db.update_paper(paper['id'], abstract=abstract or None, notes=notes or None)
+                paper['abstract'] = abstract
+                paper['notes'] = notes
+            except Exception as e:
+                logger.error(f"Saving paper {paper['id']} failed: {e}")
+                failed.append(paper.get('title') or str(paper['id']))
+        self._pending_saves.clear()
+        if failed:
+            QMessageBox.warning(self, "保存失败", "以下论文的修改未能保存:\n" + "\n".join(failed[:5]))
+        super().done(result)
+    
+    def _on_text_edited(self):
+        self._dirty = True
+        self._save_timer.start()
+    
+    def _flush_pending_save(self):
+        if self._dirty:
+            self._save_current()
     
     def _save_current(self):
+        self._save_timer.stop()
         if not self.current_paper or not self.db:
             return
         
-        try:
-            abstract = self.abstract_edit.toPlainText().strip()
-            notes = self.notes_edit.toPlainText().strip()
-            
-            self.db.update_paper(
-                self.current_paper['id'],
-                abstract=abstract or None,
-                notes=notes or None
-            )
-            
+        abstract = self.abstract_edit.toPlainText().strip()
+        notes = self.notes_edit.toPlainText().strip()
+        self._dirty = False
+        
+        paper = self.current_paper
+        # 与最近提交的内容相同（如改了又改回）时不再写库
+        if (abstract, notes) == self._last_submitted(paper):
+            if not self._save_thread and not self._pending_saves:
+                self.status_label.setText("已保存")
+                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            return
+        
+        self._pending_saves[paper['id']] = (paper, abstract, notes, 1)
+        self._start_next_save()
+    
+    def _last_submitted(self, paper):
+        """该论文最近一次提交的内容：排队中、写入中或已写入"""
+        pending = self._pending_saves.get(paper['id'])
+        if pending:
+            return pending[1], pending[2]
+        thread = self._save_thread
+        if thread and thread.paper is paper:
+            return thread.abstract, thread.notes
+        return (paper.get('abstract') or ''), (paper.get('notes') or '')
+    
+    def _start_next_save(self):
+        if self._closed or self._save_thread or not self._pending_saves:
+            return
+        paper, abstract, notes, attempt = self._pending_saves.pop(next(iter(self._pending_saves)))
+        self.status_label.setText("保存中...")
+        self.status_label.setStyleSheet("")
+        thread = PaperSaveThread(self.db, paper, abstract, notes, attempt)
+        thread.finished.connect(lambda: self._on_save_thread_finished(thread))
+        self._save_thread = thread
+        thread.start()
+    
+    def _on_save_thread_finished(self, thread):
+        if self._save_thread is thread:
+            self._save_thread = None
+        thread.deleteLater()
+        if self._closed:
+            return
+        paper = thread.paper
+        if thread.error is None:
             # 更新本地数据
-            self.current_paper['abstract'] = abstract
-            self.current_paper['notes'] = notes
-            
-            self.status_label.setText("已保存")
-            self.status_label.setStyleSheet("color: green; font-weight: bold;")
-        except Exception as e:
-            self.status_label.setText(f"保存失败: {e}")
+            paper['abstract'] = thread.abstract
+            paper['notes'] = thread.notes
+            if not self._pending_saves:
+                self.status_label.setText("已保存")
+                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+        elif paper['id'] not in self._pending_saves:
+            # 已有更新的修改排队时由其覆盖；否则稍后重试（如全文索引线程正占用数据库），
+            # 多次失败后提示一次，修改保持未保存状态，下次编辑或切换论文时再写入
+            if thread.attempt < self.SAVE_MAX_ATTEMPTS:
+                self._pending_saves[paper['id']] = (paper, thread.abstract, thread.notes, thread.attempt + 1)
+                QTimer.singleShot(self.SAVE_RETRY_MS, self._start_next_save)
+                return
+            self.status_label.setText(f"保存失败: {thread.error}")
             self.status_label.setStyleSheet("color: red;")
+            if paper is self.current_paper:
+                self._dirty = True
+        self._start_next_save()
@@ -1,15 +1,22 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, 
                                 QTextEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
                                 QGroupBox, QComboBox, QFrame, QVBoxLayout)
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QFont, QColor, QPalette, QPainter, QPen, QBrush
+from PySide6.QtCore import Qt, Signal, QThread, QUrl
+from PySide6.QtGui import QFont, QColor, QPalette, QPainter, QPen, QBrush, QDesktopServices
 from typing import Dict, Any, Callable, Optional
 import os
+import re
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# OCR文本清理用的正则，模块加载时编译一次
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MD_IMG_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+_MD_HEADING_RE = re.compile(r'^#+\s*', re.MULTILINE)
+
 
 class PatentValidationIndicator(QFrame):
     def __init__(self, parent=None):
@@ -409,17 +416,16 @@ class PatentDetailPanel(QWidget):
     def _extract_from_ocr(self, text: str) -> Dict:
         """从OCR文本中提取专利信息"""
         from core.extractor import extract_patent_info_from_text
-        import re
         
         # 清理OCR文本中的HTML标签和Markdown格式
         # 移除<div>, <img>, <span>等HTML标签
-        cleaned_text = re.sub(r'<[^>]+>', '', text)
+        cleaned_text = _HTML_TAG_RE.sub('', text)
         # 移除Markdown图片语法 ![...](...)
-        cleaned_text = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', '', cleaned_text)
+        cleaned_text = _MD_IMG_RE.sub('', cleaned_text)
         # 移除多余的空行
-        cleaned_text = re.sub(r'\n\s*\n', '\n', cleaned_text)
+        cleaned_text = _BLANK_LINE_RE.sub('\n', cleaned_text)
         # 移除行首的#号（Markdown标题）
-        cleaned_text = re.sub(r'^#+\s*', '', cleaned_text, flags=re.MULTILINE)
+        cleaned_text = _MD_HEADING_RE.sub('', cleaned_text)
         
         logger.info(f"Cleaned OCR text (first 200 chars): {cleaned_text[:200]}")
         
@@ -521,10 +527,8 @@ class PatentDetailPanel(QWidget):
         
         abs_path = self.get_abs_path(file_path) if self.get_abs_path else file_path
         if abs_path and os.path.exists(abs_path):
-            try:
-                os.startfile(abs_path)
-            except Exception as e:
-                QMessageBox.warning(self, "错误", f"无法打开文件: {e}")
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_path)):
+                QMessageBox.warning(self, "错误", f"无法打开文件: {abs_path}")
         else:
             QMessageBox.warning(self, "错误", f"文件不存在: {abs_path}")
     
@@ -551,7 +555,7 @@ class PatentDetailPanel(QWidget):
             self.db.set_patent_tags(self.current_patent['id'], tag_names)
             
             patents = self.db.get_all_patents()
-            self.patent_model.update_data(patents)
+            self.patent_model.apply(patents)
             
             self.status_label.setText("专利信息已保存")
             self.status_label.setStyleSheet("color: green;")
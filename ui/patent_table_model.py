@@ -1,44 +1,39 @@
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, QModelIndex
 from typing import List, Dict, Any
+from ui.record_table_model import RecordTableModel, DISPLAY_ROLE, BACKGROUND_ROLE, DATA_ROLES
 
 COLUMNS = ['', '专利名称', '专利类型', '专利号', '发明人', '申请日期', '授权日期', '权利人']
 COL_WIDTHS = [35, 250, 50, 180, 200, 90, 90, 150]
 
-class PatentTableModel(QAbstractTableModel):
-    def __init__(self, data: List[Dict[str, Any]] = None):
-        super().__init__()
-        self._data = data or []
-    
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
-    
+FIELD_MAP = {
+    1: 'title',
+    2: 'patent_type',
+    3: 'patent_number',
+    4: 'inventors',
+    5: 'application_date',
+    6: 'grant_date',
+    7: 'patentee'
+}
+
+class PatentTableModel(RecordTableModel):
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(COLUMNS)
     
     def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
-        if not index.isValid():
+        if not index.isValid() or role not in DATA_ROLES:
             return None
         
         row = index.row()
         col = index.column()
         
-        if role == Qt.DisplayRole:
+        if role == DISPLAY_ROLE:
             if col == 0:
                 return str(row + 1)
-            field_map = {
-                1: 'title',
-                2: 'patent_type',
-                3: 'patent_number',
-                4: 'inventors',
-                5: 'application_date',
-                6: 'grant_date',
-                7: 'patentee'
-            }
-            field = field_map.get(col, '')
+            field = FIELD_MAP.get(col, '')
             value = self._data[row].get(field, '')
             return str(value) if value else ''
         
-        if role == Qt.BackgroundRole:
+        if role == BACKGROUND_ROLE:
             confidence = self._data[row].get('confidence', 100)
             if confidence < 50:
                 return Qt.lightGray
@@ -54,14 +49,6 @@ class PatentTableModel(QAbstractTableModel):
             return COL_WIDTHS[section]
         return None
     
-    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
-        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
-    
-    def update_data(self, data: List[Dict[str, Any]]):
-        self.beginResetModel()
-        self._data = data
-        self.endResetModel()
-    
     def get_patent_at(self, row: int) -> Dict[str, Any]:
         return self._data[row] if 0 <= row < len(self._data) else None
     
@@ -0,0 +1,116 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from typing import List, Dict, Any, Optional
+
+# data() 只响应这两种角色；模块级常量避免每次调用时的属性查找
+DISPLAY_ROLE = Qt.DisplayRole
+BACKGROUND_ROLE = Qt.BackgroundRole
+DATA_ROLES = (DISPLAY_ROLE, BACKGROUND_ROLE)
+ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+class RecordTableModel(QAbstractTableModel):
+    """论文/专利/软著表格模型的公共部分：每行一个带 id 的记录字典，支持按id增量更新与原地增删改"""
+    def __init__(self, data: List[Dict[str, Any]] = None):
+        super().__init__()
+        self._data = data or []
+        # id -> 行号，按需构建，行结构变化时置空
+        self._id_index = None
+        # 数据每次变化时递增，供统计结果缓存判断是否过期
+        self._version = 0
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._data)
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return ITEM_FLAGS
+    
+    def update_data(self, data: List[Dict[str, Any]]):
+        self.beginResetModel()
+        self._data = data
+        self._id_index = None
+        self._version += 1
+        self.endResetModel()
+    
+    def apply(self, data: List[Dict[str, Any]]):
+        """按id增量更新数据：只删除/插入/刷新发生变化的行，保留视图的选中与滚动状态"""
+        old_ids = [r.get('id') for r in self._data]
+        new_ids = [r.get('id') for r in data]
+        new_id_set = set(new_ids)
+        kept_ids = [i for i in old_ids if i in new_id_set]
+        kept_id_set = set(kept_ids)
+        # id不唯一、顺序变化或变化过多时，直接重置更快
+        if (None in new_id_set or len(new_id_set) != len(new_ids)
+                or len(set(old_ids)) != len(old_ids)
+                or kept_ids != [i for i in new_ids if i in kept_id_set]
+                or (len(old_ids) - len(kept_ids)) + (len(new_ids) - len(kept_ids)) > max(len(new_ids), len(old_ids)) // 2):
+            self.update_data(data)
+            return
+        
+        self._data = list(self._data)
+        self._id_index = None
+        self._version += 1
+        # 自下而上删除已不存在的连续行
+        row = len(self._data) - 1
+        while row >= 0:
+            if self._data[row].get('id') in new_id_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._data[row].get('id') not in new_id_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._data[row + 1:last + 1]
+            self.endRemoveRows()
+        
+        # 插入新行，刷新内容变化的行
+        row = 0
+        while row < len(data):
+            if row < len(self._data) and self._data[row].get('id') == new_ids[row]:
+                if self._data[row] != data[row]:
+                    self._data[row] = data[row]
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+                row += 1
+                continue
+            first = row
+            current_id = self._data[row].get('id') if row < len(self._data) else None
+            while row < len(data) and new_ids[row] != current_id:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._data[first:first] = data[first:row]
+            self.endInsertRows()
+    
+    def move_row(self, row: int, new_row: int):
+        """将一行移动到新位置（上移/下移后原地更新，无需重新加载）"""
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), new_row + 1 if new_row > row else new_row)
+        self._data.insert(new_row, self._data.pop(row))
+        self._id_index = None
+        self._version += 1
+        self.endMoveRows()
+    
+    def update_row(self, row: int, updates: Dict[str, Any]):
+        """更新一行的部分字段并只刷新该行（新建字典，不改动查询缓存中的行）"""
+        self._data[row] = {**self._data[row], **updates}
+        self._version += 1
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+    
+    def remove_rows(self, rows: List[int]):
+        """删除指定行（删除记录后原地更新，按连续区间自下而上移除）"""
+        rows = sorted({r for r in rows if 0 <= r < len(self._data)}, reverse=True)
+        self._version += 1
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._data[first:last + 1]
+            self._id_index = None
+            self.endRemoveRows()
+    
+    def row_for_id(self, item_id) -> Optional[int]:
+        """按id查找行号"""
+        if self._id_index is None:
+            self._id_index = {r.get('id'): i for i, r in enumerate(self._data)}
+        return self._id_index.get(item_id)
@@ -0,0 +1,48 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from typing import List, Any, Callable, Optional, Sequence, Tuple
+from ui.record_table_model import DISPLAY_ROLE, ITEM_FLAGS
+
+# UserRole 返回整行原始数据，供双击等操作取用
+ROW_ROLE = Qt.UserRole
+
+
+class ResultTableModel(QAbstractTableModel):
+    """只读结果表（统计、全文搜索）：保存原始行，显示文本在视图请求可见单元格时才生成"""
+    def __init__(self, columns: Sequence[Tuple[str, Callable[[Any], str]]], parent=None):
+        super().__init__(parent)
+        self._headers = [header for header, _ in columns]
+        self._formatters = [formatter for _, formatter in columns]
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == DISPLAY_ROLE:
+            return self._formatters[index.column()](self._rows[index.row()])
+        if role == ROW_ROLE:
+            return self._rows[index.row()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return ITEM_FLAGS
+
+    def set_rows(self, rows: List[Any]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_at(self, row: int) -> Optional[Any]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
@@ -419,7 +419,7 @@ class SoftwareDetailPanel(QWidget):
             self.db.set_software_tags(self.current_software['id'], tag_names)
             
             softwares = self.db.get_all_softwares()
-            self.software_model.update_data(softwares)
+            self.software_model.apply(softwares)
             
             self.status_label.setText("软著信息已保存")
             self.status_label.setStyleSheet("color: green;")